@@ -9,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.security import create_access_token, verify_password
+from app.core.security import averify_password, create_access_token
 from app.db.database import get_async_session
 from app.models.user import User
 from app.schemas.auth import Token
@@ -49,7 +49,7 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await averify_password(form_data.password, user.hashed_password):
         logger.warning(f"Login attempt failed: Invalid password for user '{form_data.username}'")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
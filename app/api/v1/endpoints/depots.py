@@ -7,12 +7,13 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from geoalchemy2.elements import WKTElement
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_async_session
+from app.db.pagination import fetch_page
 from app.models import Depot
 from app.schemas.depot import (
     DepotCreate,
@@ -24,8 +25,35 @@ from app.services.depot_import import import_depots_from_excel, DepotImportError
 
 router = APIRouter()
 
+# Response keys for list payloads, kept in step with the schema, and the
+# matching columns so listings fetch plain rows instead of ORM objects
+_DEPOT_FIELDS = tuple(DepotResponse.model_fields)
+_DEPOT_COLUMNS = tuple(getattr(Depot, f) for f in _DEPOT_FIELDS)
 
-@router.get("", response_model=DepotListResponse)
+
+def _depot_response(depot: Depot, status_code: int = 200) -> ORJSONResponse:
+    """Serialize a DB-loaded depot straight to JSON.
+
+    A returned Response skips FastAPI's response_model validation, so the
+    declared model only documents the payload.
+    """
+    return ORJSONResponse(
+        {f: getattr(depot, f) for f in _DEPOT_FIELDS},
+        status_code=status_code,
+    )
+
+
+# Hot lookups as lambda statements: SQL is compiled once and cached, the
+# captured values are bound as parameters on each call
+def _depot_by_id(depot_id: UUID):
+    return lambda_stmt(lambda: select(Depot).where(Depot.id == depot_id))
+
+
+def _depot_code_taken(code: str):
+    return lambda_stmt(lambda: select(Depot.id).where(Depot.code == code))
+
+
+@router.get("", response_model=DepotListResponse, response_class=ORJSONResponse)
 async def list_depots(
     is_active: Optional[bool] = None,
     skip: int = Query(0, ge=0),
@@ -39,46 +67,43 @@ async def list_depots(
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return
     """
-    query = select(Depot)
+    query = lambda_stmt(
+        lambda: select(*_DEPOT_COLUMNS, func.count().over().label("total"))
+    )
+    count_query = lambda_stmt(lambda: select(func.count(Depot.id)))
 
     if is_active is not None:
-        query = query.where(Depot.is_active == is_active)
+        query += lambda q: q.where(Depot.is_active == is_active)
+        count_query += lambda q: q.where(Depot.is_active == is_active)
 
-    query = query.order_by(Depot.created_at.desc()).offset(skip).limit(limit)
+    query += lambda q: q.order_by(Depot.created_at.desc()).offset(skip).limit(limit)
 
-    result = await session.execute(query)
-    depots = result.scalars().all()
+    rows, total = await fetch_page(session, query, count_query, skip)
 
-    # Get total count
-    count_query = select(func.count(Depot.id))
-    if is_active is not None:
-        count_query = count_query.where(Depot.is_active == is_active)
-    total = await session.scalar(count_query)
-
-    return DepotListResponse(
-        total=total or 0,
-        depots=[DepotResponse.model_validate(d) for d in depots],
-    )
+    # Plain dicts straight to orjson: no model build, dump or re-validation.
+    # zip stops at the last schema field, dropping the trailing total column.
+    return ORJSONResponse({
+        "total": total,
+        "depots": [dict(zip(_DEPOT_FIELDS, row)) for row in rows],
+    })
 
 
-@router.get("/{depot_id}", response_model=DepotResponse)
+@router.get("/{depot_id}", response_model=DepotResponse, response_class=ORJSONResponse)
 async def get_depot(
     depot_id: UUID,
     session: AsyncSession = Depends(get_async_session),
 ):
     """Get a specific depot by ID."""
-    result = await session.execute(
-        select(Depot).where(Depot.id == depot_id)
-    )
+    result = await session.execute(_depot_by_id(depot_id))
     depot = result.scalar_one_or_none()
 
     if not depot:
         raise HTTPException(status_code=404, detail="Depot not found")
 
-    return DepotResponse.model_validate(depot)
+    return _depot_response(depot)
 
 
-@router.post("", response_model=DepotResponse, status_code=201)
+@router.post("", response_model=DepotResponse, response_class=ORJSONResponse, status_code=201)
 async def create_depot(
     data: DepotCreate,
     session: AsyncSession = Depends(get_async_session),
@@ -86,30 +111,24 @@ async def create_depot(
     """
     Create a new depot.
 
-    PostGIS geography point will be automatically created from latitude and longitude.
+    The projected PostGIS point will be automatically created from latitude and longitude.
     """
     # Check for duplicate code if provided
     if data.code:
-        existing = await session.execute(
-            select(Depot).where(Depot.code == data.code)
-        )
+        existing = await session.execute(_depot_code_taken(data.code))
         if existing.scalar_one_or_none():
             raise HTTPException(
                 status_code=400,
                 detail=f"Depot with code {data.code} already exists",
             )
 
-    # Create PostGIS geography point from lat/lon
-    # Format: POINT(longitude latitude) - note the order!
-    location_wkt = f"POINT({data.longitude} {data.latitude})"
-
     depot = Depot(
         name=data.name,
         code=data.code,
         address=data.address,
-        latitude=data.latitude,
-        longitude=data.longitude,
-        location=WKTElement(location_wkt, srid=4326),
+        latitude=float(data.latitude),
+        longitude=float(data.longitude),
+        location=Depot.location_from_lonlat(data.longitude, data.latitude),
         is_active=data.is_active,
         contact_person=data.contact_person,
         contact_phone=data.contact_phone,
@@ -119,19 +138,17 @@ async def create_depot(
     await session.flush()
     await session.refresh(depot)
 
-    return DepotResponse.model_validate(depot)
+    return _depot_response(depot, status_code=201)
 
 
-@router.patch("/{depot_id}", response_model=DepotResponse)
+@router.patch("/{depot_id}", response_model=DepotResponse, response_class=ORJSONResponse)
 async def update_depot(
     depot_id: UUID,
     data: DepotUpdate,
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update a depot."""
-    result = await session.execute(
-        select(Depot).where(Depot.id == depot_id)
-    )
+    result = await session.execute(_depot_by_id(depot_id))
     depot = result.scalar_one_or_none()
 
     if not depot:
@@ -142,9 +159,7 @@ async def update_depot(
 
     # If code is changing, check for duplicates
     if "code" in update_data and update_data["code"] != depot.code:
-        existing = await session.execute(
-            select(Depot).where(Depot.code == update_data["code"])
-        )
+        existing = await session.execute(_depot_code_taken(update_data["code"]))
         if existing.scalar_one_or_none():
             raise HTTPException(
                 status_code=400,
@@ -155,11 +170,14 @@ async def update_depot(
     lat_changed = "latitude" in update_data
     lon_changed = "longitude" in update_data
 
+    for key in ("latitude", "longitude"):
+        if update_data.get(key) is not None:
+            update_data[key] = float(update_data[key])
+
     if lat_changed or lon_changed:
         new_lat = update_data.get("latitude", depot.latitude)
         new_lon = update_data.get("longitude", depot.longitude)
-        location_wkt = f"POINT({new_lon} {new_lat})"
-        update_data["location"] = WKTElement(location_wkt, srid=4326)
+        update_data["location"] = Depot.location_from_lonlat(new_lon, new_lat)
 
     for field, value in update_data.items():
         setattr(depot, field, value)
@@ -167,7 +185,7 @@ async def update_depot(
     await session.flush()
     await session.refresh(depot)
 
-    return DepotResponse.model_validate(depot)
+    return _depot_response(depot)
 
 
 @router.delete("/{depot_id}", status_code=204)
@@ -181,9 +199,7 @@ async def delete_depot(
     Note: This is a hard delete. Consider implementing soft delete
     by setting is_active=False instead for production use.
     """
-    result = await session.execute(
-        select(Depot).where(Depot.id == depot_id)
-    )
+    result = await session.execute(_depot_by_id(depot_id))
     depot = result.scalar_one_or_none()
 
     if not depot:
@@ -291,11 +291,17 @@ async def import_shipments(
             time_windows = []
             tw1_start = parse_time(row.get("time_window_1_start"))
             tw1_end = parse_time(row.get("time_window_1_end"))
-            if tw1_start and tw1_end:
-                time_windows.append({"start": tw1_start, "end": tw1_end})
-
             tw2_start = parse_time(row.get("time_window_2_start"))
             tw2_end = parse_time(row.get("time_window_2_end"))
+            # parse_time returns zero-padded HH:MM, so string order is time order
+            if (tw1_start and tw1_end and tw1_start >= tw1_end) or (
+                tw2_start and tw2_end and tw2_start >= tw2_end
+            ):
+                errors.append({"row": row_num, "error": "Time window start must be before end"})
+                continue
+
+            if tw1_start and tw1_end:
+                time_windows.append({"start": tw1_start, "end": tw1_end})
             if tw2_start and tw2_end:
                 time_windows.append({"start": tw2_start, "end": tw2_end})
 
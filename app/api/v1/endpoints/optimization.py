@@ -8,7 +8,8 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt
+from sqlalchemy.orm import undefer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_async_session
@@ -23,7 +24,6 @@ from app.schemas.optimization import (
     OptimizationRequest,
     OptimizationResponse,
     OptimizationStatusResponse,
-    OptimizationResultSummary,
 )
 from app.core.celery_app import celery_app
 from app.services.tasks import run_optimization
@@ -31,6 +31,25 @@ from app.services.tasks import run_optimization
 router = APIRouter()
 
 
+def _job_by_id(job_id: UUID):
+    """Job lookup whose compiled SQL is cached; job_id is bound per call."""
+    return lambda_stmt(
+        lambda: select(OptimizationJob).where(OptimizationJob.id == job_id)
+    )
+
+
+def _job_with_results_by_id(job_id: UUID):
+    """Like _job_by_id, but also loads the deferred result id arrays."""
+    return lambda_stmt(
+        lambda: select(OptimizationJob)
+        .options(
+            undefer(OptimizationJob.route_ids),
+            undefer(OptimizationJob.unassigned_shipment_ids),
+        )
+        .where(OptimizationJob.id == job_id)
+    )
+
+
 @router.post("", response_model=OptimizationResponse, status_code=202)
 async def create_optimization_job(
     request: OptimizationRequest,
@@ -166,33 +185,12 @@ async def get_optimization_status(
     - result_summary: Metrics and statistics
     - unassigned_shipment_ids: Shipments that couldn't be assigned
     """
-    result = await session.execute(
-        select(OptimizationJob).where(OptimizationJob.id == job_id)
-    )
+    result = await session.execute(_job_with_results_by_id(job_id))
     job = result.scalar_one_or_none()
 
     if not job:
         raise HTTPException(status_code=404, detail="Optimization job not found")
 
-    # Calculate duration if available
-    duration = None
-    if job.started_at and job.completed_at:
-        duration = (job.completed_at - job.started_at).total_seconds()
-
-    # Parse result summary
-    result_summary = None
-    if job.result_summary:
-        result_summary = OptimizationResultSummary(
-            routes_created=job.result_summary.get("routes_created", 0),
-            shipments_assigned=job.result_summary.get("shipments_assigned", 0),
-            shipments_unassigned=job.result_summary.get("shipments_unassigned", 0),
-            total_distance_km=job.result_summary.get("total_distance_km"),
-            total_duration_minutes=job.result_summary.get("total_duration_minutes"),
-            total_cost=job.result_summary.get("total_cost"),
-            solver_status=job.result_summary.get("solver_status", ""),
-            solver_time_seconds=job.result_summary.get("solver_time_seconds"),
-        )
-
     return OptimizationStatusResponse(
         job_id=job.id,
         celery_task_id=job.celery_task_id,
@@ -202,8 +200,9 @@ async def get_optimization_status(
         created_at=job.created_at,
         started_at=job.started_at,
         completed_at=job.completed_at,
-        duration_seconds=duration,
-        result_summary=result_summary,
+        duration_seconds=job.duration_seconds,
+        # JSONB dict validates straight into OptimizationResultSummary
+        result_summary=job.result_summary or None,
         route_ids=job.route_ids,
         unassigned_shipment_ids=job.unassigned_shipment_ids,
         error_message=job.error_message,
@@ -223,9 +222,7 @@ async def get_optimization_violations(
     from app.models import Route, RouteStop, Shipment
 
     # Get the job
-    job_result = await session.execute(
-        select(OptimizationJob).where(OptimizationJob.id == job_id)
-    )
+    job_result = await session.execute(_job_with_results_by_id(job_id))
     job = job_result.scalar_one_or_none()
 
     if not job:
@@ -352,14 +349,14 @@ async def list_optimization_jobs(
     session: AsyncSession = Depends(get_async_session),
 ):
     """List recent optimization jobs."""
-    query = select(OptimizationJob)
+    query = lambda_stmt(lambda: select(OptimizationJob))
 
     if plan_date:
-        query = query.where(OptimizationJob.plan_date == plan_date)
+        query += lambda q: q.where(OptimizationJob.plan_date == plan_date)
     if status:
-        query = query.where(OptimizationJob.status == status)
+        query += lambda q: q.where(OptimizationJob.status == status)
 
-    query = query.order_by(OptimizationJob.created_at.desc()).limit(limit)
+    query += lambda q: q.order_by(OptimizationJob.created_at.desc()).limit(limit)
 
     result = await session.execute(query)
     jobs = result.scalars().all()
@@ -391,15 +388,13 @@ async def cancel_optimization_job(
 
     Note: Cannot cancel completed or already failed jobs.
     """
-    result = await session.execute(
-        select(OptimizationJob).where(OptimizationJob.id == job_id)
-    )
+    result = await session.execute(_job_by_id(job_id))
     job = result.scalar_one_or_none()
 
     if not job:
         raise HTTPException(status_code=404, detail="Optimization job not found")
 
-    if job.status in ("COMPLETED", "FAILED", "CANCELLED"):
+    if job.is_finished:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot cancel job with status {job.status}",
@@ -5,12 +5,16 @@ from datetime import date
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
+from geoalchemy2.functions import ST_X, ST_Y
+from sqlalchemy import select, func, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
-from app.db.database import get_async_session
+from app.db.database import get_async_session, get_async_session_factory
+from app.db.pagination import fetch_page, list_adapter
 from app.models import Route, RouteStop, RouteStatus
 from app.schemas.route import (
     RouteResponse,
@@ -30,7 +34,7 @@ async def list_routes(
     vehicle_id: Optional[UUID] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     List all routes with optional filtering.
@@ -39,30 +43,33 @@ async def list_routes(
     - **status**: Filter by route status
     - **vehicle_id**: Filter by assigned vehicle
     """
-    query = select(Route).options(selectinload(Route.stops))
+    # lambda_stmt caches the compiled SQL per filter combination; the
+    # filter values are extracted as bound parameters on each call.
+    query = lambda_stmt(
+        lambda: select(Route, func.count().over().label("total"))
+        .options(selectinload(Route.stops))
+    )
+    count_query = lambda_stmt(lambda: select(func.count(Route.id)))
 
     if plan_date:
-        query = query.where(Route.plan_date == plan_date)
+        query += lambda q: q.where(Route.plan_date == plan_date)
+        count_query += lambda q: q.where(Route.plan_date == plan_date)
     if status:
-        query = query.where(Route.status == status)
+        query += lambda q: q.where(Route.status == status)
+        count_query += lambda q: q.where(Route.status == status)
     if vehicle_id:
-        query = query.where(Route.vehicle_id == vehicle_id)
+        query += lambda q: q.where(Route.vehicle_id == vehicle_id)
+        count_query += lambda q: q.where(Route.vehicle_id == vehicle_id)
 
-    query = query.order_by(Route.plan_date.desc(), Route.created_at.desc())
-    query = query.offset(skip).limit(limit)
+    query += lambda q: (
+        q.order_by(Route.plan_date.desc(), Route.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
 
-    result = await session.execute(query)
-    routes = result.scalars().unique().all()
-
-    # Get total count
-    count_query = select(func.count(Route.id))
-    if plan_date:
-        count_query = count_query.where(Route.plan_date == plan_date)
-    if status:
-        count_query = count_query.where(Route.status == status)
-    if vehicle_id:
-        count_query = count_query.where(Route.vehicle_id == vehicle_id)
-    total = await session.scalar(count_query)
+    async with session_factory() as session:
+        rows, total = await fetch_page(session, query, count_query, skip, unique=True)
+        routes = [row.Route for row in rows]
 
     return RouteListResponse(
         items=[_route_to_response(r) for r in routes],
@@ -70,22 +77,19 @@ async def list_routes(
     )
 
 
-@router.get("/map-data")
+@router.get("/map-data", response_class=ORJSONResponse)
 async def get_routes_for_map(
     plan_date: date,
     job_id: Optional[UUID] = None,
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     Get routes with coordinates for map visualization.
 
     Returns route data with lat/lon extracted from geometry for frontend map display.
     """
-    from geoalchemy2.functions import ST_X, ST_Y
-    from sqlalchemy.orm import selectinload
-
-    query = (
-        select(Route)
+    query = lambda_stmt(
+        lambda: select(Route)
         .options(
             selectinload(Route.stops).selectinload(RouteStop.shipment),
             selectinload(Route.vehicle),
@@ -94,71 +98,75 @@ async def get_routes_for_map(
     )
 
     if job_id:
-        query = query.where(Route.optimization_job_id == job_id)
+        query += lambda q: q.where(Route.optimization_job_id == job_id)
 
-    result = await session.execute(query)
-    routes = result.scalars().unique().all()
+    # Hold the connection only for the queries; the payload is built after
+    # the session has returned it to the pool
+    async with session_factory() as session:
+        result = await session.execute(query)
+        routes = result.scalars().unique().all()
 
-    if not routes:
-        return {"routes": [], "depot": None}
+        if not routes:
+            return {"routes": [], "depot": None}
 
-    # Get depot coordinates from first route
-    depot = None
-    first_route = routes[0]
-    if first_route.depot_location:
+        # Get depot coordinates from first route (NULL location -> no depot)
+        depot = None
         depot_result = await session.execute(
             select(
                 ST_X(Route.depot_location).label("lon"),
                 ST_Y(Route.depot_location).label("lat"),
-            ).where(Route.id == first_route.id)
+            ).where(Route.id == routes[0].id)
         )
         depot_row = depot_result.first()
-        if depot_row:
+        if depot_row and depot_row.lat is not None:
             depot = {"lat": float(depot_row.lat), "lon": float(depot_row.lon)}
 
+        # Batch-fetch all stop coordinates in one query instead of one per stop
+        coord_result = await session.execute(
+            select(
+                RouteStop.id,
+                ST_X(RouteStop.location).label("lon"),
+                ST_Y(RouteStop.location).label("lat"),
+            ).where(RouteStop.route_id.in_([r.id for r in routes]))
+        )
+        coords = {row.id: {"lat": row.lat, "lon": row.lon} for row in coord_result}
+
+    no_coord = {"lat": 0, "lon": 0}
+
     map_routes = []
     for route in routes:
-        stops_data = []
-        for stop in sorted(route.stops, key=lambda s: s.sequence_number):
-            # Extract lat/lon from geometry
-            coord_result = await session.execute(
-                select(
-                    ST_X(RouteStop.location).label("lon"),
-                    ST_Y(RouteStop.location).label("lat"),
-                ).where(RouteStop.id == stop.id)
-            )
-            coord = coord_result.first()
-
-            stops_data.append({
+        stops_data = [
+            {
                 "sequence": stop.sequence_number,
-                "shipmentId": str(stop.shipment_id),
+                "shipmentId": stop.shipment_id,
                 "customerName": stop.shipment.order_number if stop.shipment else "Unknown",
                 "address": stop.address,
-                "lat": coord.lat if coord else 0,
-                "lon": coord.lon if coord else 0,
+                **coords.get(stop.id, no_coord),
                 "arrivalTime": stop.expected_arrival_at.strftime("%H:%M") if stop.expected_arrival_at else "",
                 "departureTime": stop.expected_departure_at.strftime("%H:%M") if stop.expected_departure_at else "",
-                "temperature": float(stop.predicted_arrival_temp),
-                "tempLimit": float(stop.shipment.temp_limit_upper) if stop.shipment and stop.shipment.temp_limit_upper else 8.0,
+                "temperature": stop.predicted_arrival_temp,
+                "tempLimit": stop.shipment.temp_limit_upper if stop.shipment and stop.shipment.temp_limit_upper else 8.0,
                 "feasible": stop.is_temp_feasible,
-            })
+            }
+            for stop in route.get_stops_ordered()
+        ]
 
         map_routes.append({
-            "vehicleId": str(route.vehicle_id),
+            "vehicleId": route.vehicle_id,
             "licensePlate": route.vehicle.license_plate if route.vehicle else f"Vehicle-{route.vehicle_id}",
             "color": "",  # Frontend will assign
-            "totalDistance": float(route.total_distance or 0),
+            "totalDistance": route.total_distance or 0.0,
             "totalTime": route.total_duration or 0,
             "stops": stops_data,
         })
 
-    return {"routes": map_routes, "depot": depot}
+    return ORJSONResponse({"routes": map_routes, "depot": depot})
 
 
 @router.get("/summary")
 async def get_routes_summary(
     plan_date: date,
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     Get summary of routes for a specific date.
@@ -166,8 +174,9 @@ async def get_routes_summary(
     Returns aggregate metrics for planning overview.
     """
     query = select(Route).where(Route.plan_date == plan_date)
-    result = await session.execute(query)
-    routes = result.scalars().all()
+    async with session_factory() as session:
+        result = await session.execute(query)
+        routes = result.scalars().all()
 
     if not routes:
         return {
@@ -184,7 +193,7 @@ async def get_routes_summary(
         "total_routes": len(routes),
         "total_vehicles": len(routes),
         "total_stops": sum(r.total_stops for r in routes),
-        "total_distance_km": sum(float(r.total_distance or 0) for r in routes),
+        "total_distance_km": sum(r.total_distance or 0.0 for r in routes),
         "total_duration_minutes": sum(r.total_duration or 0 for r in routes),
         "temperature_feasible_count": sum(
             1 for r in routes
@@ -198,8 +207,8 @@ async def get_routes_summary(
                 "driver_name": r.driver_name,
                 "status": r.status.value,
                 "total_stops": r.total_stops,
-                "total_distance_km": float(r.total_distance or 0),
-                "predicted_max_temp": float(r.predicted_max_temp or 0),
+                "total_distance_km": r.total_distance or 0.0,
+                "predicted_max_temp": r.predicted_max_temp or 0.0,
             }
             for r in routes
         ],
@@ -209,19 +218,20 @@ async def get_routes_summary(
 @router.get("/{route_id}", response_model=RouteResponse)
 async def get_route(
     route_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     Get a specific route by ID with all stops.
 
     Includes temperature predictions at each stop.
     """
-    result = await session.execute(
-        select(Route)
-        .options(selectinload(Route.stops))
-        .where(Route.id == route_id)
-    )
-    route = result.scalar_one_or_none()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Route)
+            .options(selectinload(Route.stops))
+            .where(Route.id == route_id)
+        )
+        route = result.scalar_one_or_none()
 
     if not route:
         raise HTTPException(status_code=404, detail="Route not found")
@@ -232,7 +242,7 @@ async def get_route(
 @router.get("/{route_id}/temperature-analysis")
 async def get_route_temperature_analysis(
     route_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     Get detailed temperature analysis for a route.
@@ -240,53 +250,65 @@ async def get_route_temperature_analysis(
     Shows temperature progression through the route with all
     thermodynamic calculations.
     """
-    result = await session.execute(
-        select(Route)
-        .options(selectinload(Route.stops))
-        .where(Route.id == route_id)
-    )
-    route = result.scalar_one_or_none()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Route)
+            .options(
+                selectinload(Route.stops).selectinload(RouteStop.shipment),
+                selectinload(Route.vehicle),
+            )
+            .where(Route.id == route_id)
+        )
+        route = result.scalar_one_or_none()
 
     if not route:
         raise HTTPException(status_code=404, detail="Route not found")
 
-    # Sort stops by sequence
-    stops = sorted(route.stops, key=lambda s: s.sequence_number)
+    # Temperature columns as flat per-stop arrays (visit order); the ORM
+    # objects supply the rest
+    stops = route.get_stops_ordered()
+    arrays = Route.to_stop_arrays(stops)
+    before_arrival = np.concatenate(([route.initial_temperature], arrays["departure"][:-1]))
+    violations = np.maximum(arrays["arrival"] - arrays["upper"], 0.0)
 
     analysis = {
         "route_id": str(route.id),
         "route_code": route.route_code,
         "vehicle_license": route.vehicle.license_plate if route.vehicle else None,
-        "initial_temperature": float(route.initial_temperature),
-        "final_temperature": float(route.predicted_final_temp or 0),
-        "max_temperature": float(route.predicted_max_temp or 0),
-        "is_feasible": all(s.is_temp_feasible for s in stops),
+        "initial_temperature": route.initial_temperature,
+        "final_temperature": route.predicted_final_temp or 0.0,
+        "max_temperature": route.predicted_max_temp or 0.0,
+        "is_feasible": route.route_feasible,
         "stops": [],
     }
 
-    current_temp = float(route.initial_temperature)
-
-    for stop in stops:
+    for stop, before, transit, cooling, arrival, door, departure, violation in zip(
+        stops,
+        before_arrival.tolist(),
+        arrays["transit"].tolist(),
+        arrays["cooling"].tolist(),
+        arrays["arrival"].tolist(),
+        arrays["service"].tolist(),
+        arrays["departure"].tolist(),
+        violations.tolist(),
+        strict=True,
+    ):
         stop_analysis = {
             "sequence": stop.sequence_number,
             "address": stop.address,
             "shipment_id": str(stop.shipment_id),
             "temperature": {
-                "before_arrival": current_temp,
-                "transit_rise": float(stop.transit_temp_rise or 0),
-                "cooling_applied": float(stop.cooling_applied or 0),
-                "arrival_temp": float(stop.predicted_arrival_temp),
-                "door_rise": float(stop.service_temp_rise or 0),
-                "departure_temp": float(stop.predicted_departure_temp or 0),
+                "before_arrival": before,
+                "transit_rise": transit,
+                "cooling_applied": cooling,
+                "arrival_temp": arrival,
+                "door_rise": door,
+                "departure_temp": departure,
             },
             "constraints": {
-                "temp_limit_upper": float(stop.shipment.temp_limit_upper) if stop.shipment else None,
+                "temp_limit_upper": stop.shipment.temp_limit_upper if stop.shipment else None,
                 "is_feasible": stop.is_temp_feasible,
-                "violation_amount": max(
-                    0,
-                    float(stop.predicted_arrival_temp) -
-                    float(stop.shipment.temp_limit_upper if stop.shipment else 999)
-                ),
+                "violation_amount": violation,
             },
             "timing": {
                 "arrival_time": stop.expected_arrival_at.isoformat() if stop.expected_arrival_at else None,
@@ -296,7 +318,6 @@ async def get_route_temperature_analysis(
         }
 
         analysis["stops"].append(stop_analysis)
-        current_temp = float(stop.predicted_departure_temp or 0)
 
     return analysis
 
@@ -357,7 +378,7 @@ async def update_route_stop(
 
 def _route_to_response(route: Route) -> RouteResponse:
     """Convert Route model to response schema."""
-    stops = sorted(route.stops, key=lambda s: s.sequence_number)
+    stops = route.get_stops_ordered()
 
     return RouteResponse(
         id=route.id,
@@ -383,7 +404,7 @@ def _route_to_response(route: Route) -> RouteResponse:
         optimization_job_id=route.optimization_job_id,
         optimization_cost=route.optimization_cost,
         algorithm_version=route.algorithm_version,
-        stops=[RouteStopResponse.model_validate(s) for s in stops],
+        stops=list_adapter(RouteStopResponse).validate_python(stops, from_attributes=True),
         created_at=route.created_at,
         updated_at=route.updated_at,
     )
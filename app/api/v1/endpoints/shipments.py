@@ -5,12 +5,12 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from geoalchemy2.elements import WKTElement
-from sqlalchemy import select, func, update, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, insert, lambda_stmt, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.database import get_async_session
-from app.models import Shipment, ShipmentStatus, Route, RouteStop
+from app.db.database import get_async_session, get_async_session_factory
+from app.db.pagination import fetch_page, list_adapter
+from app.models import Shipment, ShipmentStatus, SLATier
 from app.schemas.shipment import (
     ShipmentCreate,
     ShipmentUpdate,
@@ -21,6 +21,35 @@ from app.schemas.shipment import (
 
 router = APIRouter()
 
+def _make_point(longitude, latitude):
+    """Build a server-side PostGIS point (SRID 4326) without a WKT round trip."""
+    return func.ST_SetSRID(func.ST_MakePoint(float(longitude), float(latitude)), 4326)
+
+
+def _shipment_row(data: ShipmentCreate) -> dict:
+    """Convert a ShipmentCreate payload into column values for INSERT."""
+    return {
+        "order_number": data.order_number,
+        "customer_id": data.customer_id,
+        "delivery_address": data.delivery_address,
+        "geo_location": _make_point(data.longitude, data.latitude),
+        "latitude": data.latitude,
+        "longitude": data.longitude,
+        # Convert time windows to dict format
+        "time_windows": [tw.model_dump() for tw in data.time_windows],
+        "sla_tier": data.sla_tier,
+        "temp_limit_upper": data.temp_limit_upper,
+        "temp_limit_lower": data.temp_limit_lower,
+        "service_duration": data.service_duration,
+        "weight": data.weight,
+        "volume": data.volume,
+        # Convert dimensions if provided
+        "dimensions": data.dimensions.model_dump() if data.dimensions else None,
+        "package_count": data.package_count,
+        "priority": data.priority,
+        "special_instructions": data.special_instructions,
+    }
+
 
 @router.get("", response_model=ShipmentListResponse)
 async def list_shipments(
@@ -28,7 +57,7 @@ async def list_shipments(
     customer_id: Optional[UUID] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     List all shipments with optional filtering.
@@ -36,66 +65,93 @@ async def list_shipments(
     - **status**: Filter by shipment status
     - **customer_id**: Filter by customer
     """
-    query = select(Shipment)
+    # lambda_stmt caches the compiled SQL per filter combination; the
+    # filter values are extracted as bound parameters on each call.
+    query = lambda_stmt(lambda: select(Shipment, func.count().over().label("total")))
+    count_query = lambda_stmt(lambda: select(func.count(Shipment.id)))
 
     if status:
-        query = query.where(Shipment.status == status)
+        query += lambda q: q.where(Shipment.status == status)
+        count_query += lambda q: q.where(Shipment.status == status)
     if customer_id:
-        query = query.where(Shipment.customer_id == customer_id)
+        query += lambda q: q.where(Shipment.customer_id == customer_id)
+        count_query += lambda q: q.where(Shipment.customer_id == customer_id)
 
-    query = query.order_by(Shipment.created_at.desc())
-    query = query.offset(skip).limit(limit)
+    query += lambda q: q.order_by(Shipment.created_at.desc()).offset(skip).limit(limit)
 
-    result = await session.execute(query)
-    shipments = result.scalars().all()
-
-    # Get total count
-    count_query = select(func.count(Shipment.id))
-    if status:
-        count_query = count_query.where(Shipment.status == status)
-    if customer_id:
-        count_query = count_query.where(Shipment.customer_id == customer_id)
-    total = await session.scalar(count_query)
+    async with session_factory() as session:
+        rows, total = await fetch_page(session, query, count_query, skip)
+        shipments = [row.Shipment for row in rows]
 
     return ShipmentListResponse(
-        items=[ShipmentResponse.model_validate(s) for s in shipments],
+        items=list_adapter(ShipmentResponse).validate_python(shipments, from_attributes=True),
         total=total,
     )
 
 
 @router.get("/pending")
 async def list_pending_shipments(
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """
     List all pending shipments ready for optimization.
 
     Returns a summary suitable for optimization planning.
     """
-    query = select(Shipment).where(Shipment.status == ShipmentStatus.PENDING)
-    result = await session.execute(query)
-    shipments = result.scalars().all()
-
-    total_weight = sum(float(s.weight) for s in shipments)
-    total_volume = sum(float(s.volume or 0) for s in shipments)
-    strict_count = sum(1 for s in shipments if s.sla_tier.value == "STRICT")
+    # The two queries run one after the other on one session: an
+    # AsyncSession cannot run statements concurrently, and a second pooled
+    # connection per request would double pool demand. They stay separate
+    # (rather than window aggregates on the list query) so the totals can
+    # be answered index-only from ix_shipments_listing.
+    async with session_factory() as session:
+        # Totals are computed in PostgreSQL rather than by hydrating every row
+        totals = (
+            await session.execute(
+                lambda_stmt(
+                    lambda: select(
+                        func.count(Shipment.id).label("total_pending"),
+                        func.coalesce(func.sum(Shipment.weight), 0).label("total_weight"),
+                        func.coalesce(func.sum(Shipment.volume), 0).label("total_volume"),
+                        func.count(Shipment.id)
+                        .filter(Shipment.sla_tier == SLATier.STRICT)
+                        .label("strict_count"),
+                    ).where(Shipment.status == ShipmentStatus.PENDING)
+                )
+            )
+        ).one()
+
+        # Only the columns the response needs
+        rows = (
+            await session.execute(
+                lambda_stmt(
+                    lambda: select(
+                        Shipment.id,
+                        Shipment.order_number,
+                        Shipment.sla_tier,
+                        Shipment.temp_limit_upper,
+                        Shipment.time_windows,
+                        Shipment.weight,
+                    ).where(Shipment.status == ShipmentStatus.PENDING)
+                )
+            )
+        ).mappings().all()
 
     return {
-        "total_pending": len(shipments),
-        "strict_sla_count": strict_count,
-        "standard_sla_count": len(shipments) - strict_count,
-        "total_weight_kg": total_weight,
-        "total_volume_m3": total_volume,
+        "total_pending": totals.total_pending,
+        "strict_sla_count": totals.strict_count,
+        "standard_sla_count": totals.total_pending - totals.strict_count,
+        "total_weight_kg": float(totals.total_weight),
+        "total_volume_m3": float(totals.total_volume),
         "shipments": [
             {
-                "id": str(s.id),
-                "order_number": s.order_number,
-                "sla_tier": s.sla_tier.value,
-                "temp_limit": float(s.temp_limit_upper),
-                "time_windows": s.time_windows,
-                "weight": float(s.weight),
+                "id": str(row["id"]),
+                "order_number": row["order_number"],
+                "sla_tier": row["sla_tier"].value,
+                "temp_limit": float(row["temp_limit_upper"]),
+                "time_windows": row["time_windows"],
+                "weight": float(row["weight"]),
             }
-            for s in shipments
+            for row in rows
         ],
     }
 
@@ -103,13 +159,14 @@ async def list_pending_shipments(
 @router.get("/{shipment_id}", response_model=ShipmentResponse)
 async def get_shipment(
     shipment_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
 ):
     """Get a specific shipment by ID."""
-    result = await session.execute(
-        select(Shipment).where(Shipment.id == shipment_id)
-    )
-    shipment = result.scalar_one_or_none()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Shipment).where(Shipment.id == shipment_id)
+        )
+        shipment = result.scalar_one_or_none()
 
     if not shipment:
         raise HTTPException(status_code=404, detail="Shipment not found")
@@ -137,41 +194,12 @@ async def create_shipment(
             detail=f"Shipment with order number {data.order_number} already exists",
         )
 
-    # Create PostGIS point from coordinates
-    geo_location = WKTElement(
-        f"POINT({float(data.longitude)} {float(data.latitude)})",
-        srid=4326,
-    )
-
-    # Convert time windows to dict format
-    time_windows = [tw.model_dump() for tw in data.time_windows]
-
-    # Convert dimensions if provided
-    dimensions = data.dimensions.model_dump() if data.dimensions else None
-
-    shipment = Shipment(
-        order_number=data.order_number,
-        customer_id=data.customer_id,
-        delivery_address=data.delivery_address,
-        geo_location=geo_location,
-        latitude=data.latitude,
-        longitude=data.longitude,
-        time_windows=time_windows,
-        sla_tier=data.sla_tier,
-        temp_limit_upper=data.temp_limit_upper,
-        temp_limit_lower=data.temp_limit_lower,
-        service_duration=data.service_duration,
-        weight=data.weight,
-        volume=data.volume,
-        dimensions=dimensions,
-        package_count=data.package_count,
-        priority=data.priority,
-        special_instructions=data.special_instructions,
+    # INSERT ... RETURNING hands back server-generated columns in the same
+    # round trip, so no refresh() is needed
+    result = await session.execute(
+        insert(Shipment).values(**_shipment_row(data)).returning(Shipment)
     )
-
-    session.add(shipment)
-    await session.flush()
-    await session.refresh(shipment)
+    shipment = result.scalar_one()
 
     return ShipmentResponse.model_validate(shipment)
 
@@ -188,58 +216,38 @@ async def create_shipments_batch(
     """
     created = []
     errors = []
+    rows = []
 
-    for shipment_data in data.shipments:
-        try:
-            # Check for duplicate
-            existing = await session.execute(
-                select(Shipment).where(Shipment.order_number == shipment_data.order_number)
-            )
-            if existing.scalar_one_or_none():
-                errors.append({
-                    "order_number": shipment_data.order_number,
-                    "error": "Duplicate order number",
-                })
-                continue
-
-            geo_location = WKTElement(
-                f"POINT({float(shipment_data.longitude)} {float(shipment_data.latitude)})",
-                srid=4326,
-            )
-
-            time_windows = [tw.model_dump() for tw in shipment_data.time_windows]
-            dimensions = shipment_data.dimensions.model_dump() if shipment_data.dimensions else None
-
-            shipment = Shipment(
-                order_number=shipment_data.order_number,
-                customer_id=shipment_data.customer_id,
-                delivery_address=shipment_data.delivery_address,
-                geo_location=geo_location,
-                latitude=shipment_data.latitude,
-                longitude=shipment_data.longitude,
-                time_windows=time_windows,
-                sla_tier=shipment_data.sla_tier,
-                temp_limit_upper=shipment_data.temp_limit_upper,
-                temp_limit_lower=shipment_data.temp_limit_lower,
-                service_duration=shipment_data.service_duration,
-                weight=shipment_data.weight,
-                volume=shipment_data.volume,
-                dimensions=dimensions,
-                package_count=shipment_data.package_count,
-                priority=shipment_data.priority,
-                special_instructions=shipment_data.special_instructions,
-            )
+    # Check all order numbers for duplicates in one query
+    existing_result = await session.execute(
+        select(Shipment.order_number).where(
+            Shipment.order_number.in_([s.order_number for s in data.shipments])
+        )
+    )
+    seen = set(existing_result.scalars().all())
 
-            session.add(shipment)
-            created.append(shipment_data.order_number)
+    for shipment_data in data.shipments:
+        if shipment_data.order_number in seen:
+            errors.append({
+                "order_number": shipment_data.order_number,
+                "error": "Duplicate order number",
+            })
+            continue
 
+        try:
+            rows.append(_shipment_row(shipment_data))
+            seen.add(shipment_data.order_number)
         except Exception as e:
             errors.append({
                 "order_number": shipment_data.order_number,
                 "error": str(e),
             })
 
-    await session.flush()
+    if rows:
+        result = await session.execute(
+            insert(Shipment).values(rows).returning(Shipment.order_number)
+        )
+        created = list(result.scalars().all())
 
     return {
         "created_count": len(created),
@@ -278,10 +286,7 @@ async def update_shipment(
     if "latitude" in update_data or "longitude" in update_data:
         lat = update_data.get("latitude", shipment.latitude)
         lon = update_data.get("longitude", shipment.longitude)
-        update_data["geo_location"] = WKTElement(
-            f"POINT({float(lon)} {float(lat)})",
-            srid=4326,
-        )
+        update_data["geo_location"] = _make_point(lon, lat)
 
     for field, value in update_data.items():
         setattr(shipment, field, value)
@@ -330,26 +335,31 @@ async def reset_all_shipments(
 
     Use this to start fresh without deleting shipment data.
     """
-    # Step 1: Delete all route_stops
-    await session.execute(delete(RouteStop))
-
-    # Step 2: Reset all shipments - clear route assignment and set status to PENDING
-    await session.execute(
-        update(Shipment).values(
-            status=ShipmentStatus.PENDING,
-            route_id=None,
-            route_sequence=None,
+    # All three steps run as one statement via data-modifying CTEs. Foreign
+    # key checks fire at end of statement, so routes can be deleted in the
+    # same pass that clears shipments.route_id.
+    count = await session.scalar(
+        text(
+            """
+            WITH deleted_stops AS (
+                DELETE FROM route_stops
+            ),
+            reset_shipments AS (
+                UPDATE shipments
+                SET status = 'PENDING',
+                    route_id = NULL,
+                    route_sequence = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING 1
+            ),
+            deleted_routes AS (
+                DELETE FROM routes
+            )
+            SELECT count(*) FROM reset_shipments
+            """
         )
     )
 
-    # Step 3: Delete all routes
-    await session.execute(delete(Route))
-
-    await session.flush()
-
-    # Get count of reset shipments
-    count = await session.scalar(select(func.count(Shipment.id)))
-
     return {
         "message": "All shipments have been reset to PENDING status",
         "shipments_reset": count,
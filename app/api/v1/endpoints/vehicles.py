@@ -1,15 +1,22 @@
 """
 Vehicle API endpoints.
 """
+import base64
+import hashlib
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, update, delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
-from app.db.database import get_async_session
-from app.models import Vehicle, VehicleStatus
+from app.db.database import get_async_session, get_async_read_session
+from app.db.pagination import fetch_page, list_adapter
+from app.models import Vehicle, VehicleStatus, InsulationGrade, DoorType
 from app.schemas.vehicle import (
     VehicleCreate,
     VehicleUpdate,
@@ -19,37 +26,87 @@ from app.schemas.vehicle import (
 
 router = APIRouter()
 
+# VehicleResponse has no relationship fields; skip the model's eager
+# driver/routes/temperature_logs loads and fail loudly on any lazy load
+_NO_RELATIONSHIPS = raiseload("*")
+
+# Static part of the thermodynamics payload, built once
+_THERMO_FORMULAS = {
+    "transit_rise": "ΔT_drive = Time × (T_ambient - T_current) × K_insulation",
+    "door_rise": "ΔT_door = Time × C_door × (1 - 0.5 × IsCurtain)",
+    "cooling": "ΔT_cooling = Time × Rate_cooling",
+}
+
+# Columns read by get_vehicle_thermodynamics
+_THERMO_COLUMNS = load_only(
+    Vehicle.id,
+    Vehicle.license_plate,
+    Vehicle.insulation_grade,
+    Vehicle.k_value,
+    Vehicle.door_type,
+    Vehicle.door_coefficient,
+    Vehicle.has_strip_curtains,
+    Vehicle.cooling_rate,
+    Vehicle.min_temp_capability,
+    Vehicle.updated_at,
+)
+
+
+def _thermo_etag(vehicle_id: UUID, updated_at: datetime) -> str:
+    """Strong ETag for a vehicle's thermodynamics (changes on any UPDATE)."""
+    digest = hashlib.blake2b(
+        f"{vehicle_id}:{updated_at.isoformat()}".encode(), digest_size=16
+    ).digest()
+    return f'"{base64.urlsafe_b64encode(digest).decode().rstrip("=")}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header (may list several tags, or ``*``).
+
+    If-None-Match uses weak comparison, so a ``W/`` prefix on either side
+    is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
 
 @router.get("", response_model=VehicleListResponse)
 async def list_vehicles(
     status: Optional[VehicleStatus] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_read_session),
 ):
     """
     List all vehicles with optional filtering.
 
     - **status**: Filter by vehicle status (AVAILABLE, IN_USE, MAINTENANCE, OFFLINE)
     """
-    query = select(Vehicle)
+    query = (
+        select(Vehicle, func.count().over().label("total"))
+        .options(_NO_RELATIONSHIPS)
+    )
+    count_query = select(func.count(Vehicle.id))
 
     if status:
         query = query.where(Vehicle.status == status)
+        count_query = count_query.where(Vehicle.status == status)
 
-    query = query.offset(skip).limit(limit)
-
-    result = await session.execute(query)
-    vehicles = result.scalars().all()
+    query = query.order_by(Vehicle.id).offset(skip).limit(limit)
 
-    # Get total count
-    count_query = select(func.count(Vehicle.id))
-    if status:
-        count_query = count_query.where(Vehicle.status == status)
-    total = await session.scalar(count_query)
+    rows, total = await fetch_page(session, query, count_query, skip)
+    vehicles = [row.Vehicle for row in rows]
 
     return VehicleListResponse(
-        items=[VehicleResponse.model_validate(v) for v in vehicles],
+        items=list_adapter(VehicleResponse).validate_python(vehicles, from_attributes=True),
         total=total,
     )
 
@@ -57,11 +114,11 @@ async def list_vehicles(
 @router.get("/{vehicle_id}", response_model=VehicleResponse)
 async def get_vehicle(
     vehicle_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_read_session),
 ):
     """Get a specific vehicle by ID."""
     result = await session.execute(
-        select(Vehicle).where(Vehicle.id == vehicle_id)
+        select(Vehicle).options(_NO_RELATIONSHIPS).where(Vehicle.id == vehicle_id)
     )
     vehicle = result.scalar_one_or_none()
 
@@ -81,16 +138,6 @@ async def create_vehicle(
 
     Thermodynamic parameters will be automatically derived from insulation_grade and door_type.
     """
-    # Check for duplicate license plate
-    existing = await session.execute(
-        select(Vehicle).where(Vehicle.license_plate == data.license_plate)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=400,
-            detail=f"Vehicle with license plate {data.license_plate} already exists",
-        )
-
     # Create vehicle with derived thermodynamic values
     vehicle = Vehicle(
         license_plate=data.license_plate,
@@ -102,17 +149,26 @@ async def create_vehicle(
         internal_width=data.internal_width,
         internal_height=data.internal_height,
         insulation_grade=data.insulation_grade,
-        k_value=data.insulation_grade.k_value,
+        k_value=InsulationGrade(data.insulation_grade).k_value,
         door_type=data.door_type,
-        door_coefficient=data.door_type.coefficient,
+        door_coefficient=DoorType(data.door_type).coefficient,
         has_strip_curtains=data.has_strip_curtains,
         cooling_rate=data.cooling_rate,
         min_temp_capability=data.min_temp_capability,
     )
 
+    # Rely on the unique index on license_plate instead of a pre-check SELECT
     session.add(vehicle)
-    await session.flush()
-    await session.refresh(vehicle)
+    try:
+        await session.flush()
+    except IntegrityError as exc:
+        await session.rollback()
+        if "license_plate" not in str(exc.orig):
+            raise
+        raise HTTPException(
+            status_code=400,
+            detail=f"Vehicle with license plate {data.license_plate} already exists",
+        )
 
     return VehicleResponse.model_validate(vehicle)
 
@@ -124,30 +180,35 @@ async def update_vehicle(
     session: AsyncSession = Depends(get_async_session),
 ):
     """Update a vehicle."""
-    result = await session.execute(
-        select(Vehicle).where(Vehicle.id == vehicle_id)
-    )
-    vehicle = result.scalar_one_or_none()
-
-    if not vehicle:
-        raise HTTPException(status_code=404, detail="Vehicle not found")
-
     # Update fields
     update_data = data.model_dump(exclude_unset=True)
 
-    # If insulation_grade changes, update k_value
-    if "insulation_grade" in update_data:
-        update_data["k_value"] = update_data["insulation_grade"].k_value
-
-    # If door_type changes, update door_coefficient
-    if "door_type" in update_data:
-        update_data["door_coefficient"] = update_data["door_type"].coefficient
+    if not update_data:
+        result = await session.execute(
+            select(Vehicle).options(_NO_RELATIONSHIPS).where(Vehicle.id == vehicle_id)
+        )
+    else:
+        # If insulation_grade changes, update k_value
+        if "insulation_grade" in update_data:
+            update_data["k_value"] = InsulationGrade(update_data["insulation_grade"]).k_value
+
+        # If door_type changes, update door_coefficient
+        if "door_type" in update_data:
+            update_data["door_coefficient"] = DoorType(update_data["door_type"]).coefficient
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        result = await session.execute(
+            update(Vehicle)
+            .where(Vehicle.id == vehicle_id)
+            .values(**update_data)
+            .returning(Vehicle),
+            execution_options={"synchronize_session": False},
+        )
 
-    for field, value in update_data.items():
-        setattr(vehicle, field, value)
+    vehicle = result.scalar_one_or_none()
 
-    await session.flush()
-    await session.refresh(vehicle)
+    if not vehicle:
+        raise HTTPException(status_code=404, detail="Vehicle not found")
 
     return VehicleResponse.model_validate(vehicle)
 
@@ -159,20 +220,19 @@ async def delete_vehicle(
 ):
     """Delete a vehicle."""
     result = await session.execute(
-        select(Vehicle).where(Vehicle.id == vehicle_id)
+        delete(Vehicle).where(Vehicle.id == vehicle_id),
+        execution_options={"synchronize_session": False},
     )
-    vehicle = result.scalar_one_or_none()
 
-    if not vehicle:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
-    await session.delete(vehicle)
-
 
-@router.get("/{vehicle_id}/thermodynamics")
+@router.get("/{vehicle_id}/thermodynamics", response_class=ORJSONResponse)
 async def get_vehicle_thermodynamics(
     vehicle_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    session: AsyncSession = Depends(get_async_read_session),
 ):
     """
     Get thermodynamic parameters for a vehicle.
@@ -182,31 +242,37 @@ async def get_vehicle_thermodynamics(
     - C_door (door coefficient)
     - Has strip curtains (reduces heat loss by 50%)
     - Cooling rate (°C/min)
+
+    Responses carry an ETag derived from ``updated_at``; a matching
+    ``If-None-Match`` gets a bodiless 304.
     """
     result = await session.execute(
-        select(Vehicle).where(Vehicle.id == vehicle_id)
+        select(Vehicle)
+        .options(_THERMO_COLUMNS, _NO_RELATIONSHIPS)
+        .where(Vehicle.id == vehicle_id)
     )
     vehicle = result.scalar_one_or_none()
 
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
-    return {
-        "vehicle_id": str(vehicle.id),
+    etag = _thermo_etag(vehicle.id, vehicle.updated_at)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # orjson encodes the UUID natively
+    return ORJSONResponse({
+        "vehicle_id": vehicle.id,
         "license_plate": vehicle.license_plate,
         "thermodynamics": {
             "insulation_grade": vehicle.insulation_grade.value,
-            "k_value": float(vehicle.k_value),
+            "k_value": vehicle.k_value,
             "door_type": vehicle.door_type.value,
-            "door_coefficient": float(vehicle.door_coefficient),
+            "door_coefficient": vehicle.door_coefficient,
             "has_strip_curtains": vehicle.has_strip_curtains,
             "curtain_factor": 0.5 if vehicle.has_strip_curtains else 1.0,
-            "cooling_rate": float(vehicle.cooling_rate),
-            "min_temp_capability": float(vehicle.min_temp_capability),
-        },
-        "formulas": {
-            "transit_rise": "ΔT_drive = Time × (T_ambient - T_current) × K_insulation",
-            "door_rise": "ΔT_door = Time × C_door × (1 - 0.5 × IsCurtain)",
-            "cooling": "ΔT_cooling = Time × Rate_cooling",
+            "cooling_rate": vehicle.cooling_rate,
+            "min_temp_capability": vehicle.min_temp_capability,
         },
-    }
+        "formulas": _THERMO_FORMULAS,
+    }, headers={"ETag": etag})
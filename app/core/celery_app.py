@@ -8,13 +8,46 @@ Usage:
     # Start worker (from project root):
     celery -A app.core.celery_app worker --loglevel=info
 
+    # Start the scheduler for periodic maintenance tasks:
+    celery -A app.core.celery_app beat --loglevel=info
+
     # Start Flower monitoring (optional):
     celery -A app.core.celery_app flower --port=5555
 """
+from decimal import Decimal
+
+import orjson
 from celery import Celery
+from celery.schedules import crontab
+from kombu.serialization import register
 
 from app.core.config import settings
 
+
+def _orjson_default(obj):
+    """Fallback for types orjson does not encode natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _orjson_dumps(obj) -> str:
+    return orjson.dumps(
+        obj,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+# orjson-backed serializer for task args/results (C encoder instead of stdlib json)
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Create Celery application
 celery_app = Celery(
     "iccdds",
@@ -26,9 +59,9 @@ celery_app = Celery(
 # Celery configuration
 celery_app.conf.update(
     # Task settings
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],  # json kept for messages queued before the switch
+    result_serializer="orjson",
     timezone="Asia/Taipei",
     enable_utc=True,
 
@@ -38,6 +71,19 @@ celery_app.conf.update(
 
     # Result backend
     result_expires=86400,  # Results expire after 24 hours
+    redis_max_connections=64,  # Shared pool for the Redis result backend
+    redis_socket_keepalive=True,
+    redis_retry_on_timeout=True,
+    redis_backend_health_check_interval=30,
+    result_backend_transport_options={"retry_policy": {"timeout": 5.0}},
+
+    # Broker connection pool
+    broker_pool_limit=64,
+    broker_transport_options={
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+        "retry_on_timeout": True,
+    },
 
     # Worker settings
     worker_prefetch_multiplier=1,  # One task at a time (optimization is heavy)
@@ -56,6 +102,16 @@ celery_app.conf.update(
     # Retry settings
     task_default_retry_delay=30,
     task_max_retries=3,
+
+    # Periodic tasks (celery beat). crontab runs in the app timezone
+    # (Asia/Taipei, UTC+8, no DST): 08:05 local is 00:05 UTC, just after
+    # the UTC day boundary the telemetry partitions are cut on.
+    beat_schedule={
+        "maintain-temperature-log-partitions": {
+            "task": "app.services.tasks.maintain_temperature_log_partitions",
+            "schedule": crontab(hour=8, minute=5),
+        },
+    },
 )
 
 # Define task queues
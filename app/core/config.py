@@ -4,7 +4,7 @@ Application configuration using Pydantic Settings.
 Loads configuration from environment variables and .env file.
 """
 from decimal import Decimal
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,  # Read-only after load; nothing mutates settings at runtime
     )
 
     # =========================================================================
@@ -28,6 +29,17 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     api_v1_prefix: str = "/api/v1"
+    enable_docs: bool = True  # Set false in docs-less deployments to skip OpenAPI generation
+
+    @cached_property
+    def openapi_url(self) -> str:
+        """OpenAPI schema URL under the v1 prefix."""
+        return f"{self.api_v1_prefix}/openapi.json"
+
+    @cached_property
+    def docs_url(self) -> str:
+        """Swagger UI URL under the v1 prefix."""
+        return f"{self.api_v1_prefix}/docs"
 
     # =========================================================================
     # Security & Authentication
@@ -38,6 +50,12 @@ class Settings(BaseSettings):
     )
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440  # 24 hours
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor (use 4 in tests to keep login flows fast)",
+    )
 
     # =========================================================================
     # Database
@@ -53,8 +71,20 @@ class Settings(BaseSettings):
         description="PostgreSQL connection URL (sync for Celery)",
     )
 
+    # Pool sizing: per API process, start from
+    #   pool_size ≈ CPU_cores * 2 + effective_io_concurrency
+    # and keep (pool_size + max_overflow) * processes under max_connections.
     db_pool_size: int = 10
     db_max_overflow: int = 20
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Recycle connections before idle timeouts reap them
+    db_query_cache_size: int = 1200  # Compiled-statement cache (SQLAlchemy default 500)
+
+    # Behind pgbouncer (transaction pooling) prepared statements are not
+    # cached or reused (see app/db/database.py). jit is then not sent as a
+    # startup parameter; run ALTER ROLE <app role> SET jit = off instead.
+    db_use_pgbouncer: bool = False
+    db_statement_cache_size: int = 1024
 
     # =========================================================================
     # Redis & Celery
@@ -74,6 +104,21 @@ class Settings(BaseSettings):
         description="Celery result backend URL",
     )
 
+    # =========================================================================
+    # Telemetry
+    # =========================================================================
+    telemetry_retention_days: int = Field(
+        default=30,
+        ge=1,
+        description="Days of temperature_logs partitions to keep",
+    )
+
+    telemetry_partitions_ahead: int = Field(
+        default=3,
+        ge=1,
+        description="Daily temperature_logs partitions to create in advance",
+    )
+
     # =========================================================================
     # Optimization Defaults
     # =========================================================================
@@ -3,20 +3,29 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.security import decode_access_token
-from app.db.database import get_async_session
+from app.db.database import get_async_read_session
 from app.models.user import User
 
 # HTTP Bearer token extractor (reads Authorization: Bearer <token>)
 security = HTTPBearer(auto_error=False)
 
+# Active-user lookup, built once so its compiled form stays in the
+# statement cache. The password hash is never needed past login.
+_USER_STMT = (
+    select(User)
+    .where(User.username == bindparam("username"), User.is_active.is_(True))
+    .options(load_only(User.id, User.username, User.is_active))
+)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_async_read_session)],
 ) -> User:
     """Dependency to get current authenticated user from JWT token.
 
@@ -40,15 +49,13 @@ async def get_current_user(
     if credentials is None:
         raise credentials_exception
 
-    # Decode token
+    # Decode token (repeat tokens hit decode_access_token's TTL cache)
     username = decode_access_token(credentials.credentials)
     if username is None:
         raise credentials_exception
 
     # Fetch user from database
-    result = await session.execute(
-        select(User).where(User.username == username, User.is_active == True)
-    )
+    result = await session.execute(_USER_STMT, {"username": username})
     user = result.scalar_one_or_none()
 
     if user is None:
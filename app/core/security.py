@@ -1,15 +1,38 @@
 """Security utilities for authentication and authorization."""
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+import anyio
+from cachetools import TTLCache
+import jwt
+from jwt.exceptions import PyJWTError as JWTError
 from passlib.context import CryptContext
 from pydantic import ValidationError
 
-from app.core.config import get_settings
+from app.core.config import settings
 
 # Password hashing context (bcrypt)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
+
+# Decoded tokens: blake2b(token) -> (username, exp). Entries also expire
+# with the token itself, checked on read.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_TOKEN_CACHE_TTL_SECONDS)
+
+
+# Bound once; decode_access_token is on every authenticated request
+_JWT_ALGORITHMS = [settings.algorithm]
+
+
+def _token_key(token: str) -> bytes:
+    """Hash a token for use as a cache key (raw tokens are never stored)."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -25,6 +48,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop.
+
+    bcrypt is CPU-bound (tens to hundreds of ms per call), so the check
+    runs in a worker thread.
+
+    Args:
+        plain_password: User input password
+        hashed_password: Stored bcrypt hash
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await anyio.to_thread.run_sync(
+        pwd_context.verify, plain_password, hashed_password
+    )
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt.
 
@@ -47,7 +88,6 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT token string
     """
-    settings = get_settings()
     to_encode = data.copy()
 
     if expires_delta:
@@ -67,20 +107,34 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def decode_access_token(token: str) -> Optional[str]:
     """Decode and validate a JWT token.
 
+    Successful decodes are cached for up to a minute (never past the
+    token's own expiry) so repeated requests with the same bearer token
+    skip signature verification.
+
     Args:
         token: JWT token string
 
     Returns:
         Username (sub claim) if valid, None if invalid/expired
     """
-    settings = get_settings()
+    key = _token_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        username, exp = cached
+        if exp > time.time():
+            return username
+        _token_cache.pop(key, None)
+
     try:
         payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
+            token, settings.secret_key, algorithms=_JWT_ALGORITHMS
         )
         username: str = payload.get("sub")
         if username is None:
             return None
+        exp = payload.get("exp")
+        if exp is not None:
+            _token_cache[key] = (username, float(exp))
         return username
     except (JWTError, ValidationError):
         return None
@@ -5,16 +5,25 @@ from app.db.database import (
     Base,
     engine,
     async_session_maker,
+    async_read_session_maker,
     get_async_session,
+    get_async_read_session,
+    get_async_session_factory,
     init_db,
     drop_db,
 )
+from app.db.pagination import fetch_page, list_adapter
 
 __all__ = [
     "Base",
     "engine",
     "async_session_maker",
+    "async_read_session_maker",
     "get_async_session",
+    "get_async_read_session",
+    "get_async_session_factory",
     "init_db",
     "drop_db",
+    "fetch_page",
+    "list_adapter",
 ]
@@ -4,6 +4,8 @@ Database connection and session management for ICCDDS.
 Uses SQLAlchemy async for FastAPI compatibility.
 """
 from typing import AsyncGenerator
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import MetaData
@@ -27,13 +29,35 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+if settings.db_use_pgbouncer:
+    # Transaction pooling hands each transaction a different server
+    # connection, so no named prepared statement may outlive it: disable
+    # asyncpg's and SQLAlchemy's statement caches and give every statement
+    # a unique name. pgbouncer rejects unknown startup parameters, so jit
+    # is set server-side instead (ALTER ROLE ... SET jit = off).
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+else:
+    _connect_args = {
+        # Short OLTP queries don't benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": settings.db_statement_cache_size,
+    }
+
 # Create async engine using settings from .env
 engine = create_async_engine(
     settings.database_url,
     echo=False,  # Set to True for SQL query logging
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,  # Verify connections before use
+    query_cache_size=settings.db_query_cache_size,
+    connect_args=_connect_args,
 )
 
 # Session factory
@@ -45,6 +69,16 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only session factory. AUTOCOMMIT is a client-side flag for asyncpg,
+# so reads run without BEGIN and without a COMMIT/ROLLBACK on release,
+# while still sharing the main engine's pool.
+async_read_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -66,6 +100,41 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only FastAPI routes.
+
+    Statements run in autocommit mode, so the request pays no transaction
+    round trips. Endpoints that write must use get_async_session instead.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(session: AsyncSession = Depends(get_async_read_session)):
+            ...
+    """
+    async with async_read_session_maker() as session:
+        yield session
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency returning the session factory itself.
+
+    Lets an endpoint open short-lived sessions around its DB work, or run
+    independent queries concurrently (an AsyncSession cannot be shared by
+    concurrent awaits).
+
+    Usage:
+        @app.get("/items")
+        async def get_items(
+            session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+        ):
+            async with session_factory() as session:
+                ...
+    """
+    return async_session_maker
+
+
 async def init_db():
     """Initialize database tables (for development)."""
     async with engine.begin() as conn:
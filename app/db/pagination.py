@@ -0,0 +1,52 @@
+"""
+Offset pagination helpers for list endpoints.
+"""
+from functools import lru_cache
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import Executable, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Executable,
+    count_query: Executable,
+    skip: int,
+    unique: bool = False,
+) -> tuple[Sequence[Row[Any]], int]:
+    """
+    Run a paged query and return its rows with the unpaged total.
+
+    ``query`` must select ``func.count().over().label("total")`` alongside
+    its entities, so the total rides along each row and a page costs one
+    round trip. When the page is past the end no row carries the total,
+    and only then is ``count_query`` run.
+
+    Args:
+        session: Open session
+        query: Filtered, ordered, offset/limited select with a ``total`` column
+        count_query: ``select(func.count(...))`` with the same filters
+        skip: The query's offset
+        unique: Deduplicate rows (needed for joined eager loads)
+
+    Returns:
+        (rows, total)
+    """
+    result = await session.execute(query)
+    if unique:
+        result = result.unique()
+    rows = result.all()
+
+    if rows:
+        return rows, rows[0].total
+    if skip:
+        return rows, await session.scalar(count_query) or 0
+    return rows, 0
+
+
+@lru_cache
+def list_adapter(schema: type) -> TypeAdapter:
+    """TypeAdapter that validates a whole list of ``schema`` in one pydantic-core call."""
+    return TypeAdapter(list[schema])
@@ -8,6 +8,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.db.database import init_db
@@ -60,10 +61,11 @@ def create_application() -> FastAPI:
         3. **Cooling**: `ΔT_cooling = Time × Rate_cooling`
         """,
         version=settings.app_version,
-        openapi_url=f"{settings.api_v1_prefix}/openapi.json",
-        docs_url=f"{settings.api_v1_prefix}/docs",
-        redoc_url=f"{settings.api_v1_prefix}/redoc",
+        openapi_url=settings.openapi_url if settings.enable_docs else None,
+        docs_url=settings.docs_url if settings.enable_docs else None,
+        redoc_url=f"{settings.api_v1_prefix}/redoc" if settings.enable_docs else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -97,10 +99,10 @@ async def health_check():
 
 @app.get("/")
 async def root():
-    """Root endpoint with API info."""
+    """Root endpoint with API info (docs links are null when docs are disabled)."""
     return {
         "app": settings.app_name,
         "version": settings.app_version,
-        "docs": f"{settings.api_v1_prefix}/docs",
-        "openapi": f"{settings.api_v1_prefix}/openapi.json",
+        "docs": app.docs_url,
+        "openapi": app.openapi_url,
     }
@@ -2,15 +2,47 @@
 Base model classes and mixins for ICCDDS.
 """
 from datetime import datetime
-from typing import Any
+from enum import Enum
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, SmallInteger, TypeDecorator, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from app.db.database import Base
 
+# Identifying attributes shown by BaseModel.__repr__
+_REPR_KEYS = ("id", "name", "code", "license_plate", "order_number")
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a SMALLINT holding the member's position.
+
+    Two bytes per row instead of a native enum's four, with no catalog
+    type to create or reflect; Python code still sees Enum members.
+    Members may only be appended: stored values are declaration indexes.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._positions = {member: i for i, member in enumerate(self._members)}
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._positions[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
 
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
@@ -55,11 +87,14 @@ class BaseModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         }
 
     def __repr__(self) -> str:
-        """String representation for debugging."""
+        """String representation for debugging.
+
+        Reads only already-loaded attributes from ``__dict__`` so repr never
+        triggers a lazy or deferred column load.
+        """
         class_name = self.__class__.__name__
+        loaded = self.__dict__
         attrs = ", ".join(
-            f"{k}={v!r}"
-            for k, v in self.to_dict().items()
-            if k in ("id", "name", "code", "license_plate", "order_number")
+            f"{k}={loaded[k]!r}" for k in _REPR_KEYS if k in loaded
         )
         return f"<{class_name}({attrs})>"
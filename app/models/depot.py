@@ -3,22 +3,25 @@ Depot model for ICCDDS.
 
 Represents warehouse/depot locations where vehicles start and end their routes.
 """
-from decimal import Decimal
 from typing import Optional
 
-from geoalchemy2 import Geography
-from sqlalchemy import String, Boolean, Numeric, Text, CheckConstraint
+from geoalchemy2 import Geometry
+from sqlalchemy import String, Boolean, Float, Text, CheckConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import BaseModel
 
+# TWD97 / TM2 zone 121 (metres) - planar distance for Taiwan-scale dispatch
+DEPOT_SRID = 3826
+
 
 class Depot(BaseModel):
     """
     Warehouse/depot location model.
 
     Stores depot information including geospatial data for route optimization.
-    PostGIS geography type is used for efficient distance calculations.
+    The PostGIS location is projected to TWD97 (EPSG:3826) so distance
+    filters such as ST_DWithin are planar, in metres, and GiST-indexed.
     """
     __tablename__ = "depots"
 
@@ -48,23 +51,24 @@ class Depot(BaseModel):
     # =========================================================================
     # Geospatial Data
     # =========================================================================
-    latitude: Mapped[Decimal] = mapped_column(
-        Numeric(10, 8),
+    # DOUBLE PRECISION: loads as native float (no Decimal boxing)
+    latitude: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         comment="Latitude in decimal degrees",
     )
 
-    longitude: Mapped[Decimal] = mapped_column(
-        Numeric(11, 8),
+    longitude: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         comment="Longitude in decimal degrees",
     )
 
-    # PostGIS geography type for distance calculations
+    # Projected PostGIS point (GiST index created via spatial_index)
     location: Mapped[Optional[str]] = mapped_column(
-        Geography("POINT", srid=4326),
+        Geometry("POINT", srid=DEPOT_SRID, spatial_index=True),
         nullable=True,
-        comment="PostGIS geography point",
+        comment="PostGIS point in TWD97 / TM2 (EPSG:3826)",
     )
 
     # =========================================================================
@@ -107,6 +111,14 @@ class Depot(BaseModel):
         ),
     )
 
+    @staticmethod
+    def location_from_lonlat(longitude: float, latitude: float):
+        """SQL expression projecting a WGS84 lon/lat pair to ``DEPOT_SRID``."""
+        return func.ST_Transform(
+            func.ST_SetSRID(func.ST_MakePoint(float(longitude), float(latitude)), 4326),
+            DEPOT_SRID,
+        )
+
     def __repr__(self) -> str:
         return (
             f"<Depot(id={self.id}, name={self.name!r}, "
@@ -4,7 +4,8 @@ Driver model for ICCDDS.
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Date, Boolean
+from sqlalchemy import String, Date, Boolean, Index, func, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -29,6 +30,16 @@ class Driver(BaseModel):
     """
     __tablename__ = "drivers"
 
+    __table_args__ = (
+        # Backs "active drivers with a valid license" lookups via the
+        # is_license_valid SQL expression
+        Index(
+            "ix_drivers_active_valid",
+            "license_expiry",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     # Basic Information
     employee_id: Mapped[str] = mapped_column(
         String(50),
@@ -71,22 +82,30 @@ class Driver(BaseModel):
     )
 
     # Relationships
+    # Not loaded implicitly: callers that need them opt in with
+    # selectinload(Driver.vehicles) / selectinload(Driver.routes)
     vehicles: Mapped[list["Vehicle"]] = relationship(
         "Vehicle",
         back_populates="driver",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     routes: Mapped[list["Route"]] = relationship(
         "Route",
         back_populates="driver",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
-    @property
+    @hybrid_property
     def is_license_valid(self) -> bool:
         """Check if driver's license is still valid."""
         return self.license_expiry >= date.today()
 
+    @is_license_valid.inplace.expression
+    @classmethod
+    def _is_license_valid_expression(cls):
+        """SQL form, so license validity can be filtered in the DB."""
+        return cls.license_expiry >= func.current_date()
+
     def __repr__(self) -> str:
         return f"<Driver(id={self.id}, name={self.name!r}, employee_id={self.employee_id!r})>"
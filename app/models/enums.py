@@ -24,11 +24,15 @@ class InsulationGrade(str, Enum):
     @property
     def k_value(self) -> float:
         """Get the heat transfer coefficient for this grade."""
-        return {
-            InsulationGrade.PREMIUM: 0.02,
-            InsulationGrade.STANDARD: 0.05,
-            InsulationGrade.BASIC: 0.10,
-        }[self]
+        return _K_VALUES[self]
+
+
+# Built once; k_value is read per stop in the temperature simulation
+_K_VALUES: dict[InsulationGrade, float] = {
+    InsulationGrade.PREMIUM: 0.02,
+    InsulationGrade.STANDARD: 0.05,
+    InsulationGrade.BASIC: 0.10,
+}
 
 
 class DoorType(str, Enum):
@@ -47,10 +51,13 @@ class DoorType(str, Enum):
     @property
     def coefficient(self) -> float:
         """Get the door coefficient for this type."""
-        return {
-            DoorType.ROLL: 0.8,
-            DoorType.SWING: 1.2,
-        }[self]
+        return _DOOR_COEFFICIENTS[self]
+
+
+_DOOR_COEFFICIENTS: dict[DoorType, float] = {
+    DoorType.ROLL: 0.8,
+    DoorType.SWING: 1.2,
+}
 
 
 class SLATier(str, Enum):
@@ -105,6 +112,14 @@ class OptimizationStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+# Terminal job states, as stored string values for direct membership tests
+FINISHED_OPTIMIZATION_STATUSES: frozenset[str] = frozenset({
+    OptimizationStatus.COMPLETED.value,
+    OptimizationStatus.FAILED.value,
+    OptimizationStatus.CANCELLED.value,
+})
+
+
 class AlertType(str, Enum):
     """System alert types."""
     TEMP_EXCEEDED = "TEMP_EXCEEDED"      # Temperature above limit
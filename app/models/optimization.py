@@ -3,17 +3,24 @@ Optimization job model for ICCDDS.
 
 Tracks async optimization tasks that run via Celery.
 """
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Optional, Any
 from uuid import UUID
 
-from sqlalchemy import String, Text, Date, DateTime
+from sqlalchemy import String, Text, Date, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import BaseModel
-from app.models.enums import OptimizationStatus
+from app.models.enums import FINISHED_OPTIMIZATION_STATUSES, OptimizationStatus
+
+# Stored status strings, resolved once instead of per property access
+_PENDING = OptimizationStatus.PENDING.value
+_RUNNING = OptimizationStatus.RUNNING.value
+_COMPLETED = OptimizationStatus.COMPLETED.value
+_FAILED = OptimizationStatus.FAILED.value
 
 
 class OptimizationJob(BaseModel):
@@ -39,6 +46,16 @@ class OptimizationJob(BaseModel):
     """
     __tablename__ = "optimization_jobs"
 
+    __table_args__ = (
+        # Active-job polling only ever touches PENDING/RUNNING rows; a partial
+        # index stays tiny while finished jobs accumulate
+        Index(
+            "ix_optjobs_active",
+            "plan_date",
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
+
     # =========================================================================
     # Celery Integration
     # =========================================================================
@@ -56,8 +73,7 @@ class OptimizationJob(BaseModel):
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        default=OptimizationStatus.PENDING.value,
-        index=True,
+        default=_PENDING,
     )
 
     # Progress percentage (0-100)
@@ -70,6 +86,10 @@ class OptimizationJob(BaseModel):
     # =========================================================================
     # Input Parameters
     # =========================================================================
+    # UUID array columns are deferred: they can hold thousands of ids and
+    # job listings / cancellation never read them. Endpoints that do need
+    # them undefer explicitly.
+
     plan_date: Mapped[date] = mapped_column(
         Date,
         nullable=False,
@@ -80,6 +100,7 @@ class OptimizationJob(BaseModel):
     vehicle_ids: Mapped[Optional[list[UUID]]] = mapped_column(
         ARRAY(PG_UUID(as_uuid=True)),
         nullable=True,
+        deferred=True,
         comment="Specific vehicles to use (NULL = all available)",
     )
 
@@ -87,6 +108,7 @@ class OptimizationJob(BaseModel):
     shipment_ids: Mapped[Optional[list[UUID]]] = mapped_column(
         ARRAY(PG_UUID(as_uuid=True)),
         nullable=True,
+        deferred=True,
         comment="Specific shipments to optimize (NULL = all pending)",
     )
 
@@ -129,6 +151,7 @@ class OptimizationJob(BaseModel):
     route_ids: Mapped[Optional[list[UUID]]] = mapped_column(
         ARRAY(PG_UUID(as_uuid=True)),
         nullable=True,
+        deferred=True,
         comment="IDs of routes created by this job",
     )
 
@@ -136,6 +159,7 @@ class OptimizationJob(BaseModel):
     unassigned_shipment_ids: Mapped[Optional[list[UUID]]] = mapped_column(
         ARRAY(PG_UUID(as_uuid=True)),
         nullable=True,
+        deferred=True,
         comment="Shipments that could not be assigned",
     )
 
@@ -171,40 +195,42 @@ class OptimizationJob(BaseModel):
 
     @property
     def is_pending(self) -> bool:
-        return self.status == OptimizationStatus.PENDING.value
+        return self.status == _PENDING
 
     @property
     def is_running(self) -> bool:
-        return self.status == OptimizationStatus.RUNNING.value
+        return self.status == _RUNNING
 
     @property
     def is_completed(self) -> bool:
-        return self.status == OptimizationStatus.COMPLETED.value
+        return self.status == _COMPLETED
 
     @property
     def is_failed(self) -> bool:
-        return self.status == OptimizationStatus.FAILED.value
+        return self.status == _FAILED
 
     @property
     def is_finished(self) -> bool:
         """Check if job has finished (completed, failed, or cancelled)."""
-        return self.status in (
-            OptimizationStatus.COMPLETED.value,
-            OptimizationStatus.FAILED.value,
-            OptimizationStatus.CANCELLED.value,
-        )
+        return self.status in FINISHED_OPTIMIZATION_STATUSES
 
-    @property
+    @hybrid_property
     def duration_seconds(self) -> Optional[float]:
         """Calculate job duration in seconds."""
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
+    @duration_seconds.inplace.expression
+    @classmethod
+    def _duration_seconds_expression(cls):
+        """SQL form, so jobs can be filtered or sorted by duration in the DB."""
+        return func.extract("epoch", cls.completed_at - cls.started_at)
+
     def mark_started(self) -> None:
         """Mark job as started."""
-        self.status = OptimizationStatus.RUNNING.value
-        self.started_at = datetime.now()
+        self.status = _RUNNING
+        self.started_at = datetime.now(timezone.utc)
 
     def mark_completed(
         self,
@@ -213,16 +239,16 @@ class OptimizationJob(BaseModel):
         unassigned: Optional[list[UUID]] = None,
     ) -> None:
         """Mark job as completed with results."""
-        self.status = OptimizationStatus.COMPLETED.value
-        self.completed_at = datetime.now()
+        self.status = _COMPLETED
+        self.completed_at = datetime.now(timezone.utc)
         self.route_ids = route_ids
         self.result_summary = result_summary
         self.unassigned_shipment_ids = unassigned
 
     def mark_failed(self, error_message: str, traceback: Optional[str] = None) -> None:
         """Mark job as failed with error details."""
-        self.status = OptimizationStatus.FAILED.value
-        self.completed_at = datetime.now()
+        self.status = _FAILED
+        self.completed_at = datetime.now(timezone.utc)
         self.error_message = error_message
         self.error_traceback = traceback
 
@@ -5,11 +5,15 @@ Stores optimized delivery routes with temperature predictions at each stop.
 """
 from datetime import datetime, date
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Optional, Any, Sequence
 from uuid import UUID
 
+import numpy as np
 from geoalchemy2 import Geometry
-from sqlalchemy import String, Text, Integer, Boolean, Numeric, Enum, ForeignKey, DateTime, Date, UniqueConstraint
+from sqlalchemy import (
+    REAL, String, Text, Integer, Boolean, Numeric, Float, Enum, ForeignKey, DateTime, Date, Index, Computed,
+    true,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -21,6 +25,9 @@ if TYPE_CHECKING:
     from app.models.shipment import Shipment
     from app.models.telemetry import TemperatureLog
 
+# Column order of Route.to_stop_arrays()
+_STOP_ARRAY_COLUMNS = ("transit", "service", "cooling", "arrival", "departure", "upper")
+
 
 class Route(BaseModel):
     """
@@ -44,10 +51,10 @@ class Route(BaseModel):
         index=True,
     )
 
+    # Indexed as the leading column of ix_routes_listing
     plan_date: Mapped[date] = mapped_column(
         Date,
         nullable=False,
-        index=True,
     )
 
     # =========================================================================
@@ -87,8 +94,8 @@ class Route(BaseModel):
         default=0,
     )
 
-    total_distance: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    total_distance: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
         comment="Total route distance in km",
     )
@@ -99,14 +106,14 @@ class Route(BaseModel):
         comment="Total estimated duration in minutes",
     )
 
-    total_weight: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    total_weight: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
         comment="Total cargo weight in kg",
     )
 
-    total_volume: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    total_volume: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
         comment="Total cargo volume in m³",
     )
@@ -114,24 +121,34 @@ class Route(BaseModel):
     # =========================================================================
     # Temperature Predictions
     # =========================================================================
-    initial_temperature: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    initial_temperature: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
         comment="Starting compartment temperature (°C)",
     )
 
-    predicted_final_temp: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    predicted_final_temp: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Predicted temperature after all stops (°C)",
     )
 
-    predicted_max_temp: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    predicted_max_temp: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Highest predicted temperature during route (°C)",
     )
 
+    # Denormalized AND of the stops' is_temp_feasible, written with the
+    # stops, so feasibility filters and badges never load RouteStop rows
+    route_feasible: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        server_default=true(),
+        comment="True if every stop's predicted temperature is within limits",
+    )
+
     # =========================================================================
     # Timing
     # =========================================================================
@@ -163,9 +180,12 @@ class Route(BaseModel):
         nullable=True,
     )
 
+    # Deferred: read through ST_X/ST_Y queries, never as raw WKB
     depot_location: Mapped[Optional[str]] = mapped_column(
         Geometry("POINT", srid=4326),
         nullable=True,
+        deferred=True,
+        deferred_group="geom",
     )
 
     # =========================================================================
@@ -174,6 +194,7 @@ class Route(BaseModel):
     optimization_job_id: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("optimization_jobs.id"),
         nullable=True,
+        index=True,
     )
 
     optimization_cost: Mapped[Optional[Decimal]] = mapped_column(
@@ -190,16 +211,18 @@ class Route(BaseModel):
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Not joined into every Route query: callers that need them opt in with
+    # selectinload(Route.vehicle) / selectinload(Route.driver)
     vehicle: Mapped["Vehicle"] = relationship(
         "Vehicle",
         back_populates="routes",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     driver: Mapped[Optional["Driver"]] = relationship(
         "Driver",
         back_populates="routes",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     shipments: Mapped[list["Shipment"]] = relationship(
@@ -216,10 +239,11 @@ class Route(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    # Unbounded telemetry history: never load it alongside the parent
     temperature_logs: Mapped[list["TemperatureLog"]] = relationship(
         "TemperatureLog",
         back_populates="route",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # =========================================================================
@@ -227,10 +251,10 @@ class Route(BaseModel):
     # =========================================================================
 
     def get_stops_ordered(self) -> list["RouteStop"]:
-        """Get stops in sequence order."""
-        return sorted(self.stops, key=lambda s: s.sequence_number)
+        """Get stops in sequence order (the stops relationship is loaded ordered)."""
+        return list(self.stops)
 
-    def get_max_predicted_temp(self) -> Optional[Decimal]:
+    def get_max_predicted_temp(self) -> Optional[float]:
         """Calculate maximum predicted temperature across all stops."""
         if not self.stops:
             return None
@@ -239,7 +263,37 @@ class Route(BaseModel):
 
     def is_temperature_feasible(self) -> bool:
         """Check if all stops have feasible temperature predictions."""
-        return all(stop.is_temp_feasible for stop in self.stops)
+        return self.route_feasible
+
+    @staticmethod
+    def to_stop_arrays(stops: Sequence["RouteStop"]) -> dict[str, np.ndarray]:
+        """
+        Turn stops (in visit order, shipments loaded) into one float64 array per column.
+
+        NULL deltas become 0 and a missing upper limit becomes +inf, so the
+        arrays can be combined without masking.
+
+        Returns:
+            Dict keyed by column label (transit, service, cooling, arrival,
+            departure, upper), each array in visit order
+        """
+        inf = float("inf")
+        matrix = np.array(
+            [
+                (
+                    stop.transit_temp_rise or 0.0,
+                    stop.service_temp_rise or 0.0,
+                    stop.cooling_applied or 0.0,
+                    stop.predicted_arrival_temp,
+                    stop.predicted_departure_temp or 0.0,
+                    inf if stop.shipment is None or stop.shipment.temp_limit_upper is None
+                    else stop.shipment.temp_limit_upper,
+                )
+                for stop in stops
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(_STOP_ARRAY_COLUMNS))
+        return dict(zip(_STOP_ARRAY_COLUMNS, matrix.T))
 
     def __repr__(self) -> str:
         return (
@@ -248,6 +302,27 @@ class Route(BaseModel):
         )
 
 
+# "Infeasible routes for a day" lookups; stays small since most routes are feasible
+Index(
+    "ix_routes_infeasible",
+    Route.plan_date,
+    postgresql_where=Route.route_feasible.is_(False),
+)
+
+# Backs list_routes. Filters on a leading key prefix (plan_date, then
+# status, then vehicle_id) are index lookups. Rows come back already in
+# (plan_date DESC, created_at DESC) order only when all three are filtered;
+# other combinations, including the unfiltered list, still sort on
+# created_at within each plan_date (an incremental sort at best).
+Index(
+    "ix_routes_listing",
+    Route.plan_date.desc(),
+    Route.status,
+    Route.vehicle_id,
+    Route.created_at.desc(),
+)
+
+
 class RouteStop(BaseModel):
     """
     Individual stop in a route with predicted and actual temperature data.
@@ -261,16 +336,24 @@ class RouteStop(BaseModel):
     __tablename__ = "route_stops"
 
     __table_args__ = (
-        UniqueConstraint("route_id", "sequence_number", name="uq_route_stop_sequence"),
+        # Unique per-route sequence; the INCLUDE columns let the stops grid
+        # (temperature / feasibility per stop) run as an index-only scan
+        Index(
+            "uq_route_stop_sequence",
+            "route_id",
+            "sequence_number",
+            unique=True,
+            postgresql_include=["predicted_arrival_temp", "is_temp_feasible", "shipment_id"],
+        ),
     )
 
     # =========================================================================
     # Parent Route
     # =========================================================================
+    # Indexed as the leading column of uq_route_stop_sequence
     route_id: Mapped[UUID] = mapped_column(
         ForeignKey("routes.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Associated Shipment
@@ -289,9 +372,12 @@ class RouteStop(BaseModel):
         comment="Stop sequence (1-based)",
     )
 
+    # Deferred: read through ST_X/ST_Y queries, never as raw WKB
     location: Mapped[str] = mapped_column(
-        Geometry("POINT", srid=4326),
+        Geometry("POINT", srid=4326, spatial_index=False),
         nullable=False,
+        deferred=True,
+        deferred_group="geom",
     )
 
     address: Mapped[str] = mapped_column(
@@ -332,39 +418,51 @@ class RouteStop(BaseModel):
 
     # Predicted temperature UPON ARRIVAL at this stop
     # This is the key constraint check point: must be <= shipment.temp_limit_upper
-    predicted_arrival_temp: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    predicted_arrival_temp: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
         comment="Predicted temperature upon arrival (°C) - critical constraint",
     )
 
     # Temperature rise during transit to this stop
     # ΔT_drive = Time_travel × (T_ambient - T_current) × K_insulation
-    transit_temp_rise: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    transit_temp_rise: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="ΔT_drive: temperature rise during transit (°C)",
     )
 
     # Temperature rise during service at this stop
     # ΔT_door = Time_service × C_door_type × (1 - 0.5 × IsCurtain)
-    service_temp_rise: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    service_temp_rise: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="ΔT_door: temperature rise during service (°C)",
     )
 
     # Cooling applied during transit
     # ΔT_cooling = Time_drive × Rate_cooling
-    cooling_applied: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    cooling_applied: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="ΔT_cooling: cooling effect during transit (°C, negative)",
     )
 
+    # Net change at this stop, generated by the database so reads and
+    # aggregates do not have to combine the three nullable deltas
+    predicted_net_delta: Mapped[float] = mapped_column(
+        REAL,
+        Computed(
+            "COALESCE(transit_temp_rise, 0) + COALESCE(service_temp_rise, 0)"
+            " + COALESCE(cooling_applied, 0)",
+            persisted=True,
+        ),
+        comment="ΔT_drive + ΔT_door + ΔT_cooling (°C)",
+    )
+
     # Predicted temperature AFTER service (departure temp)
-    predicted_departure_temp: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    predicted_departure_temp: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Predicted temperature after service (°C)",
     )
@@ -380,8 +478,8 @@ class RouteStop(BaseModel):
     # =========================================================================
     # Travel Metrics (to this stop from previous)
     # =========================================================================
-    distance_from_prev: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    distance_from_prev: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
         comment="Distance from previous stop in km",
     )
@@ -400,8 +498,8 @@ class RouteStop(BaseModel):
         nullable=True,
     )
 
-    actual_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    actual_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Actual recorded temperature (°C)",
     )
@@ -419,34 +517,33 @@ class RouteStop(BaseModel):
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Loaded explicitly, e.g. selectinload(Route.stops).selectinload(RouteStop.shipment)
     route: Mapped["Route"] = relationship(
         "Route",
         back_populates="stops",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     shipment: Mapped["Shipment"] = relationship(
         "Shipment",
         back_populates="route_stop",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     # =========================================================================
     # Helper Methods
     # =========================================================================
 
-    def calculate_net_temp_change(self) -> Decimal:
+    def calculate_net_temp_change(self) -> float:
         """
         Calculate net temperature change at this stop.
 
-        Net = transit_rise + service_rise + cooling (cooling is negative)
+        Net = transit_rise + service_rise + cooling (cooling is negative),
+        read from the generated predicted_net_delta column.
         """
-        transit = self.transit_temp_rise or Decimal("0")
-        service = self.service_temp_rise or Decimal("0")
-        cooling = self.cooling_applied or Decimal("0")
-        return transit + service + cooling
+        return self.predicted_net_delta
 
-    def check_temperature_compliance(self, temp_limit: Decimal) -> bool:
+    def check_temperature_compliance(self, temp_limit: float) -> bool:
         """
         Check if predicted arrival temperature is compliant.
 
@@ -463,3 +560,13 @@ class RouteStop(BaseModel):
             f"<RouteStop(route={self.route_id}, seq={self.sequence_number}, "
             f"arrival_temp={self.predicted_arrival_temp}°C, feasible={self.is_temp_feasible})>"
         )
+
+
+# SP-GiST suits point data: smaller than the default GiST index and faster
+# for bbox / radius lookups
+Index(
+    "ix_route_stops_location_spgist",
+    RouteStop.location,
+    postgresql_using="spgist",
+)
+
@@ -3,14 +3,18 @@ Shipment model for ICCDDS.
 
 Supports complex receiving rules including multiple time windows and SLA tiers.
 """
+from array import array
 from datetime import datetime, time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, Any
 from uuid import UUID
 
 from geoalchemy2 import Geometry
-from sqlalchemy import String, Text, Integer, Boolean, Numeric, Enum, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    REAL, String, Text, Integer, Boolean, Numeric, Float, Enum, ForeignKey, DateTime, Index, Computed, DDL,
+    event,
+)
+from sqlalchemy.dialects.postgresql import INT4MULTIRANGE, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -26,7 +30,11 @@ class TimeWindow:
     Helper class representing a delivery time window.
 
     This is a value object for working with time window data stored in JSONB.
+    The "HH:MM" strings are parsed once, into time objects and minutes
+    from midnight.
     """
+    __slots__ = ("start", "end", "start_time", "end_time", "start_minutes", "end_minutes")
+
     def __init__(self, start: str, end: str):
         """
         Initialize time window.
@@ -37,25 +45,15 @@ class TimeWindow:
         """
         self.start = start
         self.end = end
-
-    @property
-    def start_time(self) -> time:
-        """Parse start as time object."""
-        parts = self.start.split(":")
-        return time(int(parts[0]), int(parts[1]))
-
-    @property
-    def end_time(self) -> time:
-        """Parse end as time object."""
-        parts = self.end.split(":")
-        return time(int(parts[0]), int(parts[1]))
+        self.start_time = time.fromisoformat(start)
+        self.end_time = time.fromisoformat(end)
+        self.start_minutes = self.start_time.hour * 60 + self.start_time.minute
+        self.end_minutes = self.end_time.hour * 60 + self.end_time.minute
 
     @property
     def duration_minutes(self) -> int:
         """Calculate window duration in minutes."""
-        start_mins = self.start_time.hour * 60 + self.start_time.minute
-        end_mins = self.end_time.hour * 60 + self.end_time.minute
-        return end_mins - start_mins
+        return self.end_minutes - self.start_minutes
 
     def contains(self, t: time) -> bool:
         """Check if a time falls within this window."""
@@ -74,6 +72,18 @@ class TimeWindow:
         return f"TimeWindow({self.start}-{self.end})"
 
 
+_MINUTES_PER_DAY = 24 * 60
+_WORD_MASK = (1 << 64) - 1
+
+
+def _mask_words(bits: int) -> array:
+    """Split a 1440-bit minute mask into 23 uint64 words."""
+    return array("Q", (
+        (bits >> shift) & _WORD_MASK
+        for shift in range(0, _MINUTES_PER_DAY, 64)
+    ))
+
+
 class Shipment(BaseModel):
     """
     Delivery order with multi-time-windows and temperature constraints.
@@ -117,10 +127,13 @@ class Shipment(BaseModel):
         nullable=False,
     )
 
-    # PostGIS geometry for lat/lon coordinates (SRID 4326 = WGS84)
+    # PostGIS geometry for lat/lon coordinates (SRID 4326 = WGS84).
+    # Deferred: responses use the denormalized latitude/longitude instead.
     geo_location: Mapped[str] = mapped_column(
-        Geometry("POINT", srid=4326),
+        Geometry("POINT", srid=4326, spatial_index=False),
         nullable=False,
+        deferred=True,
+        deferred_group="geom",
     )
 
     # Denormalized for quick access
@@ -144,6 +157,15 @@ class Shipment(BaseModel):
         comment="Array of valid delivery time windows (OR relationship)",
     )
 
+    # Same windows as minutes from midnight, derived by the database so
+    # "deliverable in [t1, t2]" filters can use the GiST index:
+    #   Shipment.time_window_ranges.op("&&")(func.int4range(t1, t2, "[]"))
+    time_window_ranges: Mapped[Any] = mapped_column(
+        INT4MULTIRANGE,
+        Computed("shipment_time_window_ranges(time_windows)", persisted=True),
+        deferred=True,
+    )
+
     # =========================================================================
     # SLA & Temperature Constraints
     # =========================================================================
@@ -155,16 +177,16 @@ class Shipment(BaseModel):
     )
 
     # Maximum acceptable temperature at delivery (HARD CONSTRAINT)
-    temp_limit_upper: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    temp_limit_upper: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
-        default=Decimal("5.0"),
+        default=5.0,
         comment="Maximum acceptable temperature - exceeding causes rejection (°C)",
     )
 
     # Optional: minimum temperature (for freeze-sensitive goods)
-    temp_limit_lower: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    temp_limit_lower: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Minimum acceptable temperature (°C)",
     )
@@ -183,14 +205,14 @@ class Shipment(BaseModel):
     # =========================================================================
     # Cargo Specifications
     # =========================================================================
-    weight: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    weight: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         comment="Total weight in kg",
     )
 
-    volume: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    volume: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
         comment="Total volume in m³",
     )
@@ -221,6 +243,7 @@ class Shipment(BaseModel):
     route_id: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("routes.id"),
         nullable=True,
+        index=True,
     )
 
     # Sequence position in route
@@ -237,8 +260,8 @@ class Shipment(BaseModel):
         nullable=True,
     )
 
-    actual_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    actual_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Actual temperature at delivery from IoT sensor (°C)",
     )
@@ -275,29 +298,50 @@ class Shipment(BaseModel):
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Not joined into every shipment query; load explicitly where needed,
+    # e.g. selectinload(Shipment.customer)
     customer: Mapped[Optional["Customer"]] = relationship(
         "Customer",
         back_populates="shipments",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     route: Mapped[Optional["Route"]] = relationship(
         "Route",
         back_populates="shipments",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
+    # Never loaded per row: batch it with selectinload(Shipment.route_stop)
     route_stop: Mapped[Optional["RouteStop"]] = relationship(
         "RouteStop",
         back_populates="shipment",
         uselist=False,
-        lazy="select",  # Changed from "joined" to avoid duplicate rows
+        lazy="raise_on_sql",
     )
 
     # =========================================================================
     # Time Window Helper Methods
     # =========================================================================
 
+    def _time_window_key(self) -> tuple[tuple[str, str], ...]:
+        """Contents of ``time_windows`` as a hashable cache key."""
+        return tuple((tw["start"], tw["end"]) for tw in self.time_windows)
+
+    def _time_window_objs(self) -> tuple[TimeWindow, ...]:
+        """
+        TimeWindow objects for ``time_windows``, rebuilt when its contents change.
+
+        Cached against the window values rather than the list object, so
+        in-place edits of the JSONB list are picked up as well.
+        """
+        key = self._time_window_key()
+        cached = self.__dict__.get("_time_window_cache")
+        if cached is None or cached[0] != key:
+            cached = (key, tuple(TimeWindow(start, end) for start, end in key))
+            self.__dict__["_time_window_cache"] = cached
+        return cached[1]
+
     def get_time_windows(self) -> list[TimeWindow]:
         """
         Get list of TimeWindow objects from JSONB data.
@@ -305,7 +349,7 @@ class Shipment(BaseModel):
         Returns:
             List of TimeWindow instances
         """
-        return [TimeWindow.from_dict(tw) for tw in self.time_windows]
+        return list(self._time_window_objs())
 
     def set_time_windows(self, windows: list[TimeWindow]) -> None:
         """
@@ -316,6 +360,34 @@ class Shipment(BaseModel):
         """
         self.time_windows = [tw.to_dict() for tw in windows]
 
+    def _time_masks(self) -> tuple[array, array]:
+        """
+        Minute-of-day masks (23 × uint64 each) for the union of all windows.
+
+        Returns (points, spans): bit ``m`` of ``points`` is set when minute
+        ``m`` itself (m:00) lies in a window; bit ``m`` of ``spans`` when
+        all of m:00-(m+1):00 does. Reversed windows (start > end) are
+        empty, as in shipment_time_window_ranges(). Cached like
+        ``_time_window_objs``.
+        """
+        key = self._time_window_key()
+        cached = self.__dict__.get("_time_mask_cache")
+        if cached is None or cached[0] != key:
+            points = spans = 0
+            for tw in self._time_window_objs():
+                start, end = tw.start_minutes, tw.end_minutes
+                if end >= start:
+                    points |= ((1 << (end - start + 1)) - 1) << start
+                    spans |= ((1 << (end - start)) - 1) << start
+            cached = (key, _mask_words(points), _mask_words(spans))
+            self.__dict__["_time_mask_cache"] = cached
+        return cached[1], cached[2]
+
+    @property
+    def time_mask(self) -> array:
+        """Union of all windows as a 1440-bit minute-of-day mask (23 × uint64)."""
+        return self._time_masks()[0]
+
     def is_time_valid(self, delivery_time: time) -> bool:
         """
         Check if a delivery time satisfies any time window (OR logic).
@@ -326,20 +398,19 @@ class Shipment(BaseModel):
         Returns:
             True if time falls within any window
         """
-        for tw in self.get_time_windows():
-            if tw.contains(delivery_time):
-                return True
-        return False
+        points, spans = self._time_masks()
+        # Past m:00 the time is only inside a window that also covers (m+1):00
+        words = spans if delivery_time.second or delivery_time.microsecond else points
+        minute = delivery_time.hour * 60 + delivery_time.minute
+        return bool((words[minute >> 6] >> (minute & 63)) & 1)
 
     def get_earliest_start(self) -> time:
         """Get the earliest start time across all windows."""
-        windows = self.get_time_windows()
-        return min(tw.start_time for tw in windows)
+        return time(*divmod(min(tw.start_minutes for tw in self._time_window_objs()), 60))
 
     def get_latest_end(self) -> time:
         """Get the latest end time across all windows."""
-        windows = self.get_time_windows()
-        return max(tw.end_time for tw in windows)
+        return time(*divmod(max(tw.end_minutes for tw in self._time_window_objs()), 60))
 
     # =========================================================================
     # Constraint Checking
@@ -355,10 +426,10 @@ class Shipment(BaseModel):
         Returns:
             True if temperature is compliant
         """
-        if temperature > float(self.temp_limit_upper):
+        if temperature > self.temp_limit_upper:
             return False
         if self.temp_limit_lower is not None:
-            if temperature < float(self.temp_limit_lower):
+            if temperature < self.temp_limit_lower:
                 return False
         return True
 
@@ -372,3 +443,56 @@ class Shipment(BaseModel):
             f"<Shipment(id={self.id}, order={self.order_number!r}, "
             f"sla={self.sla_tier.value}, temp_limit={self.temp_limit_upper}°C)>"
         )
+
+
+# Backs list_shipments (status/customer filters ordered by created_at DESC).
+# INCLUDE columns let the /pending aggregate run as an index-only scan; the
+# /pending list also reads time_windows (wide JSONB), so it visits the heap.
+Index(
+    "ix_shipments_listing",
+    Shipment.status,
+    Shipment.customer_id,
+    Shipment.created_at.desc(),
+    postgresql_include=["id", "order_number", "sla_tier", "temp_limit_upper", "weight", "volume"],
+)
+
+# SP-GiST suits point data: smaller than the default GiST index and faster
+# for bbox / radius lookups
+Index(
+    "ix_shipments_geo_location_spgist",
+    Shipment.geo_location,
+    postgresql_using="spgist",
+)
+
+Index(
+    "ix_shipments_time_window_ranges",
+    Shipment.time_window_ranges,
+    postgresql_using="gist",
+)
+
+# IMMUTABLE helper backing the time_window_ranges generated column; must
+# exist before the table is created. A reversed window (start > end) is
+# empty, as in Shipment.time_mask, instead of aborting the INSERT.
+# range_agg needs PostgreSQL 14+.
+event.listen(
+    Shipment.__table__,
+    "before_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION shipment_time_window_ranges(windows jsonb)
+        RETURNS int4multirange LANGUAGE sql IMMUTABLE AS $$
+            SELECT coalesce(
+                range_agg(CASE WHEN m.s <= m.e
+                    THEN int4range(m.s, m.e, '[]') ELSE 'empty'::int4range END),
+                '{}'::int4multirange
+            )
+            FROM jsonb_array_elements(windows) AS w,
+            LATERAL (
+                SELECT
+                    split_part(w->>'start', ':', 1)::int * 60
+                        + split_part(w->>'start', ':', 2)::int AS s,
+                    split_part(w->>'end', ':', 1)::int * 60
+                        + split_part(w->>'end', ':', 2)::int AS e
+            ) AS m
+        $$
+    """),
+)
@@ -4,16 +4,18 @@ Telemetry and Alert models for ICCDDS.
 Handles IoT sensor data and system alerts.
 """
 from datetime import datetime
-from decimal import Decimal
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Optional, Any, Iterable
 from uuid import UUID
 
-from geoalchemy2 import Geometry
-from sqlalchemy import String, Text, Boolean, Numeric, Enum, ForeignKey, DateTime
+from sqlalchemy import (
+    REAL, String, Text, Boolean, Float, Integer, ForeignKey, DateTime, Index, CheckConstraint, DDL,
+    event, insert,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.core.config import settings
+from app.models.base import BaseModel, SmallIntEnum
 from app.models.enums import AlertType, AlertSeverity
 
 if TYPE_CHECKING:
@@ -21,6 +23,13 @@ if TYPE_CHECKING:
     from app.models.route import Route
     from app.models.shipment import Shipment
 
+# Degrees over the threshold at which a temperature alert becomes CRITICAL
+_CRITICAL_TEMP_MARGIN = 3.0
+
+# Rows per executemany call in TemperatureLog.bulk_insert; each call is
+# sent as multi-row INSERT ... VALUES statements
+_BULK_INSERT_BATCH = 10_000
+
 
 class TemperatureLog(BaseModel):
     """
@@ -28,17 +37,34 @@ class TemperatureLog(BaseModel):
 
     This table receives frequent inserts from vehicle IoT sensors.
     Uses BRIN index on recorded_at for efficient time-series queries.
+    Range-partitioned by day on recorded_at; the daily partitions are
+    UNLOGGED (they skip WAL and are emptied after a crash).
+    An insert trigger copies each vehicle's latest reading onto
+    vehicles.current_temperature / current position / last_telemetry_at.
 
     Attributes:
         vehicle_id: Source vehicle
         route_id: Active route (if any)
         temperature: Compartment temperature reading
-        location: GPS coordinates at time of reading
+        latitude, longitude: GPS coordinates at time of reading
         recorded_at: Timestamp of the reading
         is_cooling_active: Whether refrigeration unit is running
         ambient_temperature: Outside temperature (if sensor available)
     """
     __tablename__ = "temperature_logs"
+    __table_args__ = (
+        # Rows arrive in recorded_at order, so a BRIN block-range summary is
+        # a fraction of a B-tree's size and nearly free to maintain on insert
+        Index(
+            "ix_temperature_logs_recorded_at_brin",
+            "recorded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        # One partition per UTC day (see maintain_temperature_log_partitions);
+        # retention drops whole partitions instead of DELETE + VACUUM
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
 
     # =========================================================================
     # References
@@ -57,24 +83,30 @@ class TemperatureLog(BaseModel):
     # =========================================================================
     # Temperature Reading
     # =========================================================================
-    temperature: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    temperature: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
         comment="Compartment temperature (°C)",
     )
 
-    # Location at time of reading
-    location: Mapped[Optional[str]] = mapped_column(
-        Geometry("POINT", srid=4326),
+    # GPS position at time of reading; plain floats are smaller than a
+    # geometry and need no EWKB decoding
+    latitude: Mapped[Optional[float]] = mapped_column(
+        Float,
         nullable=True,
     )
 
-    # Timestamp of reading (indexed with BRIN for time-series efficiency)
+    longitude: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
+    # Timestamp of reading (BRIN-indexed, see __table_args__). Part of the
+    # primary key because it is the partition key.
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
+        primary_key=True,
         default=datetime.utcnow,
-        index=True,  # Note: In production, use BRIN index via raw SQL
     )
 
     # =========================================================================
@@ -86,8 +118,8 @@ class TemperatureLog(BaseModel):
         comment="True if refrigeration unit is running",
     )
 
-    ambient_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    ambient_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Outside ambient temperature (°C)",
     )
@@ -95,18 +127,51 @@ class TemperatureLog(BaseModel):
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Telemetry reads only need the ids; load parents explicitly when needed
     vehicle: Mapped["Vehicle"] = relationship(
         "Vehicle",
         back_populates="temperature_logs",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     route: Mapped[Optional["Route"]] = relationship(
         "Route",
         back_populates="temperature_logs",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert many sensor readings with batched multi-row INSERTs.
+
+        Rows hold column values. From an AsyncSession call it as
+        ``await session.run_sync(TemperatureLog.bulk_insert, rows)``.
+
+        Args:
+            session: Open session; the caller commits
+            rows: Readings as column dicts
+
+        Returns:
+            Number of rows inserted
+        """
+        stmt = insert(cls)
+        batch = []
+        inserted = 0
+
+        for row in rows:
+            batch.append(row)
+            if len(batch) == _BULK_INSERT_BATCH:
+                session.execute(stmt, batch)
+                inserted += len(batch)
+                batch = []
+
+        if batch:
+            session.execute(stmt, batch)
+            inserted += len(batch)
+
+        return inserted
+
     def __repr__(self) -> str:
         return (
             f"<TemperatureLog(vehicle={self.vehicle_id}, "
@@ -114,6 +179,78 @@ class TemperatureLog(BaseModel):
         )
 
 
+# Catch-all for readings outside the pre-created daily partitions
+event.listen(
+    TemperatureLog.__table__,
+    "after_create",
+    DDL("CREATE UNLOGGED TABLE temperature_logs_default PARTITION OF temperature_logs DEFAULT"),
+)
+
+# Today's UTC partition plus telemetry_partitions_ahead more, so readings go
+# to daily partitions from the start; maintain_temperature_log_partitions
+# keeps the window rolling. %% is DDL's escape for a literal %.
+event.listen(
+    TemperatureLog.__table__,
+    "after_create",
+    DDL(f"""
+        DO $$
+        DECLARE d date;
+        BEGIN
+            FOR i IN 0..{settings.telemetry_partitions_ahead} LOOP
+                d := (now() AT TIME ZONE 'UTC')::date + i;
+                EXECUTE format(
+                    'CREATE UNLOGGED TABLE IF NOT EXISTS %%I PARTITION OF temperature_logs '
+                    'FOR VALUES FROM (%%L) TO (%%L)',
+                    'temperature_logs_p' || to_char(d, 'YYYYMMDD'),
+                    d::text || ' 00:00+00',
+                    (d + 1)::text || ' 00:00+00'
+                );
+            END LOOP;
+        END
+        $$
+    """),
+)
+
+# Keeps the vehicle's "latest reading" columns current so dashboards never
+# touch the log table. Statement-level with a transition table, so a bulk
+# insert issues one UPDATE per batch rather than one per reading.
+event.listen(
+    TemperatureLog.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION temperature_logs_update_vehicle()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE vehicles AS v
+            SET current_temperature = latest.temperature,
+                current_latitude = coalesce(latest.latitude, v.current_latitude),
+                current_longitude = coalesce(latest.longitude, v.current_longitude),
+                last_telemetry_at = latest.recorded_at
+            FROM (
+                SELECT DISTINCT ON (vehicle_id)
+                    vehicle_id, temperature, latitude, longitude, recorded_at
+                FROM new_rows
+                ORDER BY vehicle_id, recorded_at DESC
+            ) AS latest
+            WHERE v.id = latest.vehicle_id
+              AND (v.last_telemetry_at IS NULL OR v.last_telemetry_at < latest.recorded_at);
+            RETURN NULL;
+        END
+        $$
+    """),
+)
+event.listen(
+    TemperatureLog.__table__,
+    "after_create",
+    DDL("""
+        CREATE TRIGGER trg_temperature_logs_vehicle
+        AFTER INSERT ON temperature_logs
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION temperature_logs_update_vehicle()
+    """),
+)
+
+
 class Alert(BaseModel):
     """
     System alerts for temperature and SLA violations.
@@ -131,6 +268,23 @@ class Alert(BaseModel):
     - CRITICAL: Immediate action required
     """
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Containment queries on ad-hoc detail keys (details @> '{...}')
+        Index(
+            "ix_alerts_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+        CheckConstraint(
+            "alert_type BETWEEN 0 AND %d" % (len(AlertType) - 1),
+            name="valid_alert_type",
+        ),
+        CheckConstraint(
+            "severity BETWEEN 0 AND %d" % (len(AlertSeverity) - 1),
+            name="valid_alert_severity",
+        ),
+    )
 
     # =========================================================================
     # Related Entities
@@ -153,14 +307,16 @@ class Alert(BaseModel):
     # =========================================================================
     # Alert Classification
     # =========================================================================
+    # Stored as smallint positions (see SmallIntEnum), range-checked in
+    # __table_args__
     alert_type: Mapped[AlertType] = mapped_column(
-        Enum(AlertType, name="alert_type", create_type=False),
+        SmallIntEnum(AlertType),
         nullable=False,
         index=True,
     )
 
     severity: Mapped[AlertSeverity] = mapped_column(
-        Enum(AlertSeverity, name="alert_severity", create_type=False),
+        SmallIntEnum(AlertSeverity),
         nullable=False,
         default=AlertSeverity.WARNING,
     )
@@ -173,28 +329,53 @@ class Alert(BaseModel):
         nullable=False,
     )
 
-    # Additional structured details
+    # Additional structured details. Deferred (with resolution_notes) so
+    # alert lists skip the wide columns; detail views load them with
+    # undefer_group("alert_detail").
     details: Mapped[Optional[dict[str, Any]]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
+        deferred_group="alert_detail",
         comment="Additional alert details in structured format",
     )
 
     # =========================================================================
     # Temperature Context (for temperature alerts)
     # =========================================================================
-    current_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    current_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Temperature at time of alert (°C)",
     )
 
-    threshold_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    threshold_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Temperature threshold that was violated (°C)",
     )
 
+    temp_diff: Mapped[Optional[float]] = mapped_column(
+        REAL,
+        nullable=True,
+        comment="Degrees above the threshold (°C)",
+    )
+
+    # =========================================================================
+    # ETA Context (for ETA alerts)
+    # =========================================================================
+    expected_arrival: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    delay_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        index=True,
+        comment="Minutes past the time window end",
+    )
+
     # =========================================================================
     # Acknowledgement
     # =========================================================================
@@ -231,24 +412,28 @@ class Alert(BaseModel):
     resolution_notes: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="alert_detail",
     )
 
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Alert lists should not join three parent tables per row; callers that
+    # read these use selectinload(Alert.vehicle) etc.
     vehicle: Mapped[Optional["Vehicle"]] = relationship(
         "Vehicle",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     route: Mapped[Optional["Route"]] = relationship(
         "Route",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     shipment: Mapped[Optional["Shipment"]] = relationship(
         "Shipment",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     # =========================================================================
@@ -282,8 +467,8 @@ class Alert(BaseModel):
     def create_temp_alert(
         cls,
         vehicle_id: UUID,
-        current_temp: Decimal,
-        threshold: Decimal,
+        current_temp: float,
+        threshold: float,
         route_id: Optional[UUID] = None,
         shipment_id: Optional[UUID] = None,
     ) -> "Alert":
@@ -300,7 +485,13 @@ class Alert(BaseModel):
         Returns:
             New Alert instance
         """
-        severity = AlertSeverity.CRITICAL if current_temp > threshold + 3 else AlertSeverity.WARNING
+        current_temp = float(current_temp)
+        threshold = float(threshold)
+        severity = (
+            AlertSeverity.CRITICAL if current_temp > threshold + _CRITICAL_TEMP_MARGIN
+            else AlertSeverity.WARNING
+        )
+        temp_diff = current_temp - threshold
 
         return cls(
             vehicle_id=vehicle_id,
@@ -311,8 +502,9 @@ class Alert(BaseModel):
             message=f"Temperature {current_temp}°C exceeds limit {threshold}°C",
             current_temperature=current_temp,
             threshold_temperature=threshold,
+            temp_diff=temp_diff,
             details={
-                "temp_diff": float(current_temp - threshold),
+                "temp_diff": temp_diff,
                 "auto_generated": True,
             },
         )
@@ -350,6 +542,8 @@ class Alert(BaseModel):
             alert_type=AlertType.ETA_VIOLATION,
             severity=severity,
             message=f"Expected arrival {delay_minutes} min after time window closes at {time_window_end}",
+            expected_arrival=expected_arrival,
+            delay_minutes=delay_minutes,
             details={
                 "expected_arrival": expected_arrival.isoformat(),
                 "time_window_end": time_window_end,
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from geoalchemy2 import Geometry
-from sqlalchemy import String, Boolean, Numeric, Enum, ForeignKey, DateTime
+from sqlalchemy import REAL, String, Boolean, Float, Numeric, Enum, ForeignKey, DateTime, Computed
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -43,6 +43,8 @@ class Vehicle(BaseModel):
       Used in: ΔT_cooling = Time_drive × Rate_cooling
     """
     __tablename__ = "vehicles"
+    # Fetch server-generated timestamps via INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # =========================================================================
     # Basic Identification
@@ -69,14 +71,14 @@ class Vehicle(BaseModel):
     # =========================================================================
     # Capacity Constraints
     # =========================================================================
-    capacity_weight: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    capacity_weight: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         comment="Maximum weight capacity in kg",
     )
 
-    capacity_volume: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    capacity_volume: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         comment="Maximum volume capacity in m³",
     )
@@ -100,6 +102,15 @@ class Vehicle(BaseModel):
         comment="Internal height in meters",
     )
 
+    # Generated by the database so vehicles can be filtered / sorted by
+    # cargo space in SQL; NULL when any dimension is missing
+    internal_volume: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(10, 3),
+        Computed("internal_length * internal_width * internal_height", persisted=True),
+        index=True,
+        comment="Internal volume in m³ (length × width × height)",
+    )
+
     # =========================================================================
     # THERMODYNAMIC PROPERTIES (Critical for cold-chain)
     # =========================================================================
@@ -114,10 +125,10 @@ class Vehicle(BaseModel):
 
     # K-value mapping (derived from insulation_grade, stored for efficiency)
     # PREMIUM=0.02, STANDARD=0.05, BASIC=0.10
-    k_value: Mapped[Decimal] = mapped_column(
-        Numeric(5, 4),
+    k_value: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        default=Decimal("0.05"),
+        default=0.05,
         comment="Heat transfer coefficient (derived from insulation_grade)",
     )
 
@@ -131,10 +142,10 @@ class Vehicle(BaseModel):
 
     # Door coefficient (derived from door_type)
     # ROLL=0.8, SWING=1.2
-    door_coefficient: Mapped[Decimal] = mapped_column(
-        Numeric(4, 2),
+    door_coefficient: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        default=Decimal("0.8"),
+        default=0.8,
         comment="Door heat loss coefficient (derived from door_type)",
     )
 
@@ -148,18 +159,18 @@ class Vehicle(BaseModel):
 
     # Cooling rate: refrigeration unit cooling speed
     # Typical value: -2.0 to -5.0 (negative means cooling)
-    cooling_rate: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    cooling_rate: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        default=Decimal("-2.5"),
+        default=-2.5,
         comment="Temperature change per minute when refrigeration active (°C/min)",
     )
 
     # Minimum achievable temperature
-    min_temp_capability: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    min_temp_capability: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
-        default=Decimal("-25.0"),
+        default=-25.0,
         comment="Minimum achievable compartment temperature (°C)",
     )
 
@@ -172,16 +183,33 @@ class Vehicle(BaseModel):
         default=VehicleStatus.AVAILABLE,
     )
 
-    # Current location (real-time GPS update from IoT)
-    # PostGIS POINT with SRID 4326 (WGS84)
+    # Current location (real-time GPS update from IoT), stored as plain
+    # floats so reading it needs no geometry decoding
+    current_latitude: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
+    current_longitude: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
+    # PostGIS POINT (SRID 4326) generated from the columns above, for
+    # spatial queries only; deferred so vehicle reads skip it
     current_location: Mapped[Optional[str]] = mapped_column(
         Geometry("POINT", srid=4326),
-        nullable=True,
+        Computed(
+            "ST_SetSRID(ST_MakePoint(current_longitude, current_latitude), 4326)",
+            persisted=True,
+        ),
+        deferred=True,
+        deferred_group="geom",
     )
 
     # Current compartment temperature (real-time IoT update)
-    current_temperature: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+    current_temperature: Mapped[Optional[float]] = mapped_column(
+        REAL,
         nullable=True,
         comment="Current compartment temperature from IoT sensor (°C)",
     )
@@ -195,10 +223,12 @@ class Vehicle(BaseModel):
     # =========================================================================
     # Relationships
     # =========================================================================
+    # Displays use the denormalized driver_name; load the Driver explicitly
+    # (selectinload(Vehicle.driver)) when the full record is needed
     driver: Mapped[Optional["Driver"]] = relationship(
         "Driver",
         back_populates="vehicles",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     routes: Mapped[list["Route"]] = relationship(
@@ -207,10 +237,11 @@ class Vehicle(BaseModel):
         lazy="selectin",
     )
 
+    # Unbounded telemetry history: never load it alongside the parent
     temperature_logs: Mapped[list["TemperatureLog"]] = relationship(
         "TemperatureLog",
         back_populates="vehicle",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # =========================================================================
@@ -236,9 +267,7 @@ class Vehicle(BaseModel):
         Returns:
             Temperature rise in °C (positive value means warming)
         """
-        k = float(self.k_value)
-        delta_t = travel_time_minutes * (ambient_temp - current_temp) * k
-        return delta_t
+        return travel_time_minutes * (ambient_temp - current_temp) * self.k_value
 
     def calculate_door_temp_rise(
         self,
@@ -257,10 +286,8 @@ class Vehicle(BaseModel):
         Returns:
             Temperature rise in °C (positive value)
         """
-        c_door = float(self.door_coefficient)
         curtain_factor = 0.5 if self.has_strip_curtains else 1.0
-        delta_t = service_time_minutes * c_door * curtain_factor
-        return delta_t
+        return service_time_minutes * self.door_coefficient * curtain_factor
 
     def calculate_cooling_effect(
         self,
@@ -277,9 +304,7 @@ class Vehicle(BaseModel):
         Returns:
             Temperature change in °C (negative value means cooling)
         """
-        rate = float(self.cooling_rate)
-        delta_t = cooling_time_minutes * rate
-        return delta_t
+        return cooling_time_minutes * self.cooling_rate
 
     def predict_temperature_at_stop(
         self,
@@ -334,13 +359,6 @@ class Vehicle(BaseModel):
             "departure_temp": departure_temp,
         }
 
-    @property
-    def internal_volume(self) -> Optional[Decimal]:
-        """Calculate internal volume from dimensions."""
-        if all([self.internal_length, self.internal_width, self.internal_height]):
-            return self.internal_length * self.internal_width * self.internal_height
-        return None
-
     def __repr__(self) -> str:
         return (
             f"<Vehicle(id={self.id}, plate={self.license_plate!r}, "
@@ -15,10 +15,6 @@ class BaseSchema(BaseModel):
         from_attributes=True,  # Enable ORM mode
         populate_by_name=True,
         use_enum_values=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        },
     )
 
 
@@ -53,14 +49,17 @@ class PaginatedResponse(BaseSchema, Generic[T]):
         page: int,
         page_size: int,
     ) -> "PaginatedResponse[T]":
-        """Factory method to create paginated response."""
-        total_pages = (total + page_size - 1) // page_size
-        return cls(
+        """Factory method to create paginated response.
+
+        Built without validation: items must already be schema instances
+        and the counts come from the query layer.
+        """
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages,
+            total_pages=-(-total // page_size),
         )
 
 
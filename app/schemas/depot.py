@@ -22,6 +22,10 @@ class DepotBase(BaseSchema):
     contact_person: Optional[str] = Field(None, max_length=100)
     contact_phone: Optional[str] = Field(None, max_length=20)
 
+
+class DepotCreate(DepotBase):
+    """Schema for creating a new depot."""
+
     @field_validator("latitude", "longitude")
     @classmethod
     def validate_coordinates(cls, v: Decimal) -> Decimal:
@@ -32,11 +36,6 @@ class DepotBase(BaseSchema):
         return v
 
 
-class DepotCreate(DepotBase):
-    """Schema for creating a new depot."""
-    pass
-
-
 class DepotUpdate(BaseSchema):
     """Schema for updating a depot (all fields optional)."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -51,6 +50,8 @@ class DepotUpdate(BaseSchema):
 
 class DepotResponse(DepotBase):
     """Schema for depot responses (includes ID and timestamps)."""
+    latitude: float
+    longitude: float
     id: UUID
     created_at: datetime
     updated_at: datetime
@@ -8,7 +8,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from app.models.enums import OptimizationStatus
+from app.models.enums import FINISHED_OPTIMIZATION_STATUSES, OptimizationStatus
 from app.schemas.base import BaseSchema
 
 
@@ -117,15 +117,20 @@ class OptimizationResponse(BaseSchema):
 
 
 class OptimizationResultSummary(BaseSchema):
-    """Summary of optimization results."""
-    routes_created: int
-    shipments_assigned: int
-    shipments_unassigned: int
-    total_distance_km: Optional[Decimal]
-    total_duration_minutes: Optional[int]
-    total_cost: Optional[Decimal]
-    solver_status: str
-    solver_time_seconds: Optional[float]
+    """
+    Summary of optimization results.
+
+    Mirrors the ``OptimizationJob.result_summary`` JSONB written by the
+    optimization task, so the stored dict validates into it directly.
+    """
+    routes_created: int = 0
+    shipments_assigned: int = 0
+    shipments_unassigned: int = 0
+    total_distance_km: Optional[Decimal] = None
+    total_duration_minutes: Optional[int] = None
+    total_cost: Optional[Decimal] = None
+    solver_status: str = ""
+    solver_time_seconds: Optional[float] = None
 
 
 class OptimizationStatusResponse(BaseSchema):
@@ -157,11 +162,7 @@ class OptimizationStatusResponse(BaseSchema):
     @property
     def is_finished(self) -> bool:
         """Check if job has finished."""
-        return self.status in (
-            OptimizationStatus.COMPLETED.value,
-            OptimizationStatus.FAILED.value,
-            OptimizationStatus.CANCELLED.value,
-        )
+        return self.status in FINISHED_OPTIMIZATION_STATUSES
 
     @property
     def is_success(self) -> bool:
@@ -38,35 +38,35 @@ class RouteStopResponse(BaseSchema):
     slack_minutes: Optional[int]
 
     # THERMODYNAMIC PREDICTIONS
-    predicted_arrival_temp: Decimal = Field(
+    predicted_arrival_temp: float = Field(
         ...,
         description="Predicted temperature upon arrival (°C) - critical constraint",
     )
-    transit_temp_rise: Optional[Decimal] = Field(
+    transit_temp_rise: Optional[float] = Field(
         None,
         description="ΔT_drive: temperature rise during transit (°C)",
     )
-    service_temp_rise: Optional[Decimal] = Field(
+    service_temp_rise: Optional[float] = Field(
         None,
         description="ΔT_door: temperature rise during service (°C)",
     )
-    cooling_applied: Optional[Decimal] = Field(
+    cooling_applied: Optional[float] = Field(
         None,
         description="ΔT_cooling: cooling effect (°C, negative)",
     )
-    predicted_departure_temp: Optional[Decimal] = Field(
+    predicted_departure_temp: Optional[float] = Field(
         None,
         description="Predicted temperature after service (°C)",
     )
     is_temp_feasible: bool
 
     # Travel metrics
-    distance_from_prev: Optional[Decimal]
+    distance_from_prev: Optional[float]
     travel_time_from_prev: Optional[int]
 
     # Actual results
     actual_arrival_at: Optional[datetime]
-    actual_temperature: Optional[Decimal]
+    actual_temperature: Optional[float]
     delivery_status: Optional[DeliveryStatus]
     notes: Optional[str]
 
@@ -91,15 +91,15 @@ class RouteResponse(BaseSchema):
 
     # Summary metrics
     total_stops: int
-    total_distance: Optional[Decimal]
+    total_distance: Optional[float]
     total_duration: Optional[int]
-    total_weight: Optional[Decimal]
-    total_volume: Optional[Decimal]
+    total_weight: Optional[float]
+    total_volume: Optional[float]
 
     # Temperature predictions
-    initial_temperature: Decimal
-    predicted_final_temp: Optional[Decimal]
-    predicted_max_temp: Optional[Decimal]
+    initial_temperature: float
+    predicted_final_temp: Optional[float]
+    predicted_max_temp: Optional[float]
 
     # Timing
     planned_departure_at: Optional[datetime]
@@ -151,6 +151,6 @@ class RouteSummary(BaseSchema):
     driver_name: Optional[str]
     status: RouteStatus
     total_stops: int
-    total_distance: Optional[Decimal]
-    predicted_max_temp: Optional[Decimal]
+    total_distance: Optional[float]
+    predicted_max_temp: Optional[float]
     is_temperature_feasible: bool
@@ -162,22 +162,19 @@ class ShipmentResponse(ShipmentBase):
     order_number: str
     customer_id: Optional[UUID]
 
-    # Location (geo_location is handled separately)
-    geo_location: Optional[Any] = Field(None, exclude=True)  # Exclude raw geometry
-
     # Time windows
     time_windows: list[TimeWindowSchema]
 
     # SLA & Temperature
     sla_tier: SLATier
-    temp_limit_upper: Decimal
-    temp_limit_lower: Optional[Decimal]
+    temp_limit_upper: float
+    temp_limit_lower: Optional[float]
 
     # Service parameters
     service_duration: int
 
     # Cargo specifications
-    volume: Optional[Decimal]
+    volume: Optional[float]
     dimensions: Optional[dict[str, Any]]
     package_count: int
 
@@ -188,7 +185,7 @@ class ShipmentResponse(ShipmentBase):
 
     # Delivery results
     actual_arrival_at: Optional[datetime]
-    actual_temperature: Optional[Decimal]
+    actual_temperature: Optional[float]
     was_on_time: Optional[bool]
     was_temp_compliant: Optional[bool]
 
@@ -123,16 +123,16 @@ class VehicleResponse(VehicleBase):
 
     # Thermodynamic parameters
     insulation_grade: InsulationGrade
-    k_value: Decimal
+    k_value: float
     door_type: DoorType
-    door_coefficient: Decimal
+    door_coefficient: float
     has_strip_curtains: bool
-    cooling_rate: Decimal
-    min_temp_capability: Decimal
+    cooling_rate: float
+    min_temp_capability: float
 
     # Status
     status: VehicleStatus
-    current_temperature: Optional[Decimal]
+    current_temperature: Optional[float]
     last_telemetry_at: Optional[datetime]
 
     # Timestamps
@@ -2,12 +2,10 @@
 Depot Excel import service with optional geocoding.
 """
 import asyncio
-from decimal import Decimal
 from typing import Optional
 
 import pandas as pd
-from geoalchemy2.elements import WKTElement
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Depot
@@ -103,8 +101,8 @@ async def import_depots_from_excel(
             if has_coords:
                 # Use provided coordinates
                 try:
-                    latitude = Decimal(str(lat))
-                    longitude = Decimal(str(lon))
+                    latitude = float(lat)
+                    longitude = float(lon)
                 except (ValueError, TypeError) as e:
                     stats["failed"] += 1
                     stats["errors"].append(f"Row {row_num}: Invalid coordinates - {e}")
@@ -114,8 +112,8 @@ async def import_depots_from_excel(
                 # Geocode address
                 try:
                     result = await geocoding_service.geocode(address, country="Taiwan")
-                    latitude = result.latitude
-                    longitude = result.longitude
+                    latitude = float(result.latitude)
+                    longitude = float(result.longitude)
                     stats["geocoded"] += 1
                 except GeocodingError as e:
                     stats["failed"] += 1
@@ -138,16 +136,13 @@ async def import_depots_from_excel(
             # Check for duplicate code
             if code:
                 existing = await session.execute(
-                    select(Depot).where(Depot.code == code)
+                    lambda_stmt(lambda: select(Depot.id).where(Depot.code == code))
                 )
                 if existing.scalar_one_or_none():
                     stats["failed"] += 1
                     stats["errors"].append(f"Row {row_num}: Duplicate code '{code}'")
                     continue
 
-            # Create PostGIS geography point
-            location_wkt = f"POINT({longitude} {latitude})"
-
             # Create depot
             depot = Depot(
                 name=name,
@@ -155,7 +150,7 @@ async def import_depots_from_excel(
                 address=address if address else None,
                 latitude=latitude,
                 longitude=longitude,
-                location=WKTElement(location_wkt, srid=4326),
+                location=Depot.location_from_lonlat(longitude, latitude),
                 is_active=is_active,
                 contact_person=contact_person,
                 contact_phone=contact_phone,
@@ -12,6 +12,11 @@ from app.services.solver.data_model import (
     compute_distance_matrix,
     compute_time_matrix,
 )
+from app.services.solver.thermal import (
+    RouteTemperatureProfile,
+    simulate_route_temperatures,
+    temperature_compliance_mask,
+)
 from app.services.solver.callbacks import (
     TemperatureTracker,
     create_distance_callback,
@@ -34,6 +39,10 @@ __all__ = [
     "build_vrp_data_model",
     "compute_distance_matrix",
     "compute_time_matrix",
+    # Thermodynamics
+    "RouteTemperatureProfile",
+    "simulate_route_temperatures",
+    "temperature_compliance_mask",
     # Callbacks
     "TemperatureTracker",
     "create_distance_callback",
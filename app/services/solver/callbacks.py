@@ -7,9 +7,13 @@ Includes:
 - Demand callbacks (weight, volume)
 - Temperature tracking callback (thermodynamic model)
 """
+from math import nan
 from typing import Callable
 
+import numpy as np
+
 from app.services.solver.data_model import VRPDataModel, VehicleData
+from app.services.solver.thermal import RouteTemperatureProfile, simulate_route_temperatures
 
 
 def create_distance_callback(
@@ -128,6 +132,46 @@ class TemperatureTracker:
         # Key: (vehicle_index, node_sequence_tuple) -> temperature at each node
         self._temp_cache: dict[tuple, list[float]] = {}
 
+        # Per-node constraint arrays, built once so each route evaluation
+        # gathers them with a fancy index instead of Python list building
+        nodes = data.nodes
+        self._temp_upper = np.array([n.temp_limit_upper for n in nodes], dtype=np.float64)
+        self._temp_lower = np.array(
+            [nan if n.temp_limit_lower is None else n.temp_limit_lower for n in nodes],
+            dtype=np.float64,
+        )
+        self._is_strict = np.array([n.is_strict_sla for n in nodes], dtype=bool)
+        self._service = np.array([n.service_duration for n in nodes], dtype=np.float64)
+        self._time_matrix = np.asarray(data.time_matrix, dtype=np.float64).reshape(len(nodes), len(nodes))
+
+    def _route_profile(
+        self,
+        vehicle_index: int,
+        route_nodes: list[int],
+    ) -> tuple[list[int], RouteTemperatureProfile | None]:
+        """Simulate a route; returns (stop node indices, profile or None)."""
+        vehicle = self.data.vehicles[vehicle_index]
+        depot_index = self.data.depot_index
+        stops = [n for n in route_nodes if n != depot_index]
+        if not stops:
+            return stops, None
+
+        prev_nodes = [depot_index] + stops[:-1]
+
+        profile = simulate_route_temperatures(
+            travel_minutes=self._time_matrix[prev_nodes, stops],
+            service_minutes=self._service[stops],
+            temp_limit_upper=self._temp_upper[stops],
+            temp_limit_lower=self._temp_lower[stops],
+            initial_temp=vehicle.initial_temp,
+            ambient_temp=self.data.ambient_temperature,
+            k_value=vehicle.k_value,
+            door_coefficient=vehicle.door_coefficient,
+            has_strip_curtains=vehicle.has_strip_curtains,
+            cooling_rate=vehicle.cooling_rate,
+        )
+        return stops, profile
+
     def calculate_route_temperatures(
         self,
         vehicle_index: int,
@@ -153,70 +197,33 @@ class TemperatureTracker:
                 'violation_amount': float,
             }
         """
-        vehicle = self.data.vehicles[vehicle_index]
-        ambient = self.data.ambient_temperature
-        results = []
-
-        # Start with initial vehicle temperature
-        current_temp = vehicle.initial_temp
-        prev_node = self.data.depot_index
-
-        for node_idx in route_nodes:
-            if node_idx == self.data.depot_index:
-                continue
-
-            node = self.data.nodes[node_idx]
-
-            # Get travel time from previous node
-            travel_time = self.data.time_matrix[prev_node][node_idx]
-
-            # Calculate temperature changes
-            # 1. Transit temperature rise
-            transit_rise = vehicle.calculate_transit_temp_rise(
-                travel_time, ambient, current_temp
-            )
-
-            # 2. Cooling during transit (refrigeration active)
-            cooling_effect = vehicle.calculate_cooling_effect(travel_time)
-
-            # Temperature upon arrival
-            arrival_temp = current_temp + transit_rise + cooling_effect
+        stops, profile = self._route_profile(vehicle_index, route_nodes)
+        if profile is None:
+            return []
 
-            # 3. Door temperature rise during service
-            door_rise = vehicle.calculate_door_temp_rise(node.service_duration)
-
-            # Temperature after service (departure temp)
-            departure_temp = arrival_temp + door_rise
-
-            # Check feasibility
-            is_feasible = arrival_temp <= node.temp_limit_upper
-            violation_amount = max(0, arrival_temp - node.temp_limit_upper)
-
-            # Also check lower limit if specified
-            if node.temp_limit_lower is not None:
-                if arrival_temp < node.temp_limit_lower:
-                    is_feasible = False
-                    violation_amount = max(
-                        violation_amount,
-                        node.temp_limit_lower - arrival_temp
-                    )
-
-            results.append({
+        return [
+            {
                 'node_index': node_idx,
-                'arrival_temp': arrival_temp,
-                'departure_temp': departure_temp,
-                'transit_rise': transit_rise,
-                'door_rise': door_rise,
-                'cooling_effect': cooling_effect,
-                'is_feasible': is_feasible,
-                'violation_amount': violation_amount,
-            })
-
-            # Update for next iteration
-            current_temp = departure_temp
-            prev_node = node_idx
-
-        return results
+                'arrival_temp': arrival,
+                'departure_temp': departure,
+                'transit_rise': transit,
+                'door_rise': door,
+                'cooling_effect': cooling,
+                'is_feasible': feasible,
+                'violation_amount': violation,
+            }
+            for node_idx, arrival, departure, transit, door, cooling, feasible, violation
+            in zip(
+                stops,
+                profile.arrival_temp.tolist(),
+                profile.departure_temp.tolist(),
+                profile.transit_rise.tolist(),
+                profile.door_rise.tolist(),
+                profile.cooling_effect.tolist(),
+                profile.is_feasible.tolist(),
+                profile.violation_amount.tolist(),
+            )
+        ]
 
     def get_temperature_penalty(
         self,
@@ -232,23 +239,18 @@ class TemperatureTracker:
         Returns:
             Total penalty (0 if no violations)
         """
-        temps = self.calculate_route_temperatures(vehicle_index, route_nodes)
-        total_penalty = 0
-
-        for temp_info in temps:
-            node_idx = temp_info['node_index']
-            node = self.data.nodes[node_idx]
+        stops, profile = self._route_profile(vehicle_index, route_nodes)
+        if profile is None:
+            return 0
 
-            if not temp_info['is_feasible']:
-                if node.is_strict_sla:
-                    # Strict SLA: route is infeasible
-                    return self.infeasible_cost
-                else:
-                    # Standard SLA: add penalty
-                    violation = temp_info['violation_amount']
-                    total_penalty += int(violation * self.temp_violation_penalty)
+        violated = ~profile.is_feasible
+        if (violated & self._is_strict[stops]).any():
+            # Strict SLA: route is infeasible
+            return self.infeasible_cost
 
-        return total_penalty
+        # Standard SLA: penalty proportional to each violation (truncated per stop)
+        penalties = profile.violation_amount[violated] * self.temp_violation_penalty
+        return int(penalties.astype(np.int64).sum())
 
     def is_route_feasible(
         self,
@@ -260,16 +262,11 @@ class TemperatureTracker:
 
         A route is infeasible if any STRICT SLA shipment has temperature violation.
         """
-        temps = self.calculate_route_temperatures(vehicle_index, route_nodes)
-
-        for temp_info in temps:
-            node_idx = temp_info['node_index']
-            node = self.data.nodes[node_idx]
+        stops, profile = self._route_profile(vehicle_index, route_nodes)
+        if profile is None:
+            return True
 
-            if not temp_info['is_feasible'] and node.is_strict_sla:
-                return False
-
-        return True
+        return not (~profile.is_feasible & self._is_strict[stops]).any()
 
 
 def create_temperature_transit_callback(
@@ -288,6 +285,9 @@ def create_temperature_transit_callback(
     requires post-processing the solution since OR-Tools callbacks
     don't have full route context during search.
     """
+    # Average vehicle K-value is fixed for the job; compute it once, not per arc
+    avg_k = sum(v.k_value for v in data.vehicles) / len(data.vehicles)
+
     def temp_transit_callback(from_index: int, to_index: int) -> int:
         """
         Returns additional cost for temperature impact.
@@ -306,8 +306,6 @@ def create_temperature_transit_callback(
 
         # Estimate temperature rise for this arc
         # Use average vehicle parameters for estimation
-        avg_k = sum(v.k_value for v in data.vehicles) / len(data.vehicles)
-
         # Estimate temp rise (simplified)
         estimated_rise = travel_time * data.ambient_temperature * avg_k * 0.1
 
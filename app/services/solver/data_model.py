@@ -7,10 +7,17 @@ This includes distance/time matrices and node information.
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Optional
-from math import radians, sin, cos, sqrt, atan2
+from math import pi, radians, sin, cos, sqrt, atan2
 
+import numpy as np
 
-@dataclass
+# WGS84 ellipsoid constants for the equirectangular ("cheap ruler") metric
+_WGS84_RADIUS_M = 6378137.0
+_WGS84_FLATTENING = 1 / 298.257223563
+_WGS84_E2 = _WGS84_FLATTENING * (2 - _WGS84_FLATTENING)
+
+
+@dataclass(slots=True)
 class LocationNode:
     """Represents a location (depot or delivery point) in the VRP model."""
     index: int  # OR-Tools node index
@@ -49,7 +56,7 @@ class LocationNode:
         return self.shipment_id is None
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleData:
     """Represents a vehicle in the VRP model with thermodynamic properties."""
     index: int  # OR-Tools vehicle index
@@ -197,26 +204,58 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
-def compute_distance_matrix(nodes: list[LocationNode]) -> list[list[int]]:
+def ruler_factors(latitude: float) -> tuple[float, float]:
+    """
+    Metres per degree of longitude and latitude at a reference latitude.
+
+    Equirectangular approximation on the WGS84 ellipsoid; within a few
+    hundred km of the reference latitude it stays within ~0.1% of the
+    geodesic distance.
+    """
+    cos_lat = cos(radians(latitude))
+    w2 = 1 / (1 - _WGS84_E2 * (1 - cos_lat * cos_lat))
+    w = sqrt(w2)
+    metres_per_degree = _WGS84_RADIUS_M * pi / 180
+    kx = metres_per_degree * w * cos_lat
+    ky = metres_per_degree * w * w2 * (1 - _WGS84_E2)
+    return kx, ky
+
+
+def compute_distance_matrix(
+    nodes: list[LocationNode],
+    accurate: bool = False,
+) -> list[list[int]]:
     """
     Compute distance matrix between all nodes.
 
     Returns distances in METERS (OR-Tools prefers integers).
-    """
-    n = len(nodes)
-    matrix = [[0] * n for _ in range(n)]
 
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                dist_km = haversine_distance(
-                    nodes[i].latitude, nodes[i].longitude,
-                    nodes[j].latitude, nodes[j].longitude,
-                )
-                # Convert to meters and round to integer
-                matrix[i][j] = int(dist_km * 1000)
+    By default uses an equirectangular ruler scaled at the nodes' mean
+    latitude, which is accurate for city/region-scale dispatch. Pass
+    ``accurate=True`` for great-circle (haversine) distances on
+    cross-region problems. Both are evaluated as NumPy array operations.
+    """
+    lat = np.array([n.latitude for n in nodes], dtype=np.float64)
+    lon = np.array([n.longitude for n in nodes], dtype=np.float64)
+
+    if accurate:
+        lat_rad = np.radians(lat)
+        lon_rad = np.radians(lon)
+        dlat = lat_rad[None, :] - lat_rad[:, None]
+        dlon = lon_rad[None, :] - lon_rad[:, None]
+        a = (
+            np.sin(dlat / 2) ** 2
+            + np.cos(lat_rad)[:, None] * np.cos(lat_rad)[None, :] * np.sin(dlon / 2) ** 2
+        )
+        dist_m = 2 * 6371.0 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)) * 1000
+    else:
+        kx, ky = ruler_factors(float(lat.mean())) if len(nodes) else (0.0, 0.0)
+        dx = (lon[None, :] - lon[:, None]) * kx
+        dy = (lat[None, :] - lat[:, None]) * ky
+        dist_m = np.hypot(dx, dy)
 
-    return matrix
+    # Truncate to whole metres (diagonal is already 0)
+    return dist_m.astype(np.int64).tolist()
 
 
 def compute_time_matrix(
@@ -229,21 +268,12 @@ def compute_time_matrix(
 
     Returns travel times in MINUTES (rounded).
     """
-    n = len(nodes)
-    matrix = [[0] * n for _ in range(n)]
-
     # Convert speed to m/min
     speed_m_per_min = (average_speed_kmh * 1000) / 60
 
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                # Time = distance / speed
-                dist_meters = distance_matrix[i][j]
-                time_minutes = dist_meters / speed_m_per_min
-                matrix[i][j] = int(round(time_minutes))
-
-    return matrix
+    # Time = distance / speed; np.rint rounds half-to-even like round()
+    distances = np.asarray(distance_matrix, dtype=np.float64).reshape(len(nodes), len(nodes))
+    return np.rint(distances / speed_m_per_min).astype(np.int64).tolist()
 
 
 def time_str_to_minutes(time_str: str) -> int:
@@ -35,7 +35,7 @@ from app.services.solver.callbacks import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteStopResult:
     """Result for a single stop in a route."""
     sequence: int
@@ -69,7 +69,7 @@ class RouteStopResult:
     is_strict_sla: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteResult:
     """Result for a complete vehicle route."""
     vehicle_index: int
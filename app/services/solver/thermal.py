@@ -0,0 +1,124 @@
+"""
+Vectorized thermodynamic simulation for VRP routes.
+
+Evaluates the temperature formulas for every stop of a route with NumPy
+array operations instead of per-stop method calls:
+
+- ΔT_drive = Time_travel × (T_ambient - T_current) × K_insulation
+- ΔT_door = Time_service × C_door_type × (1 - 0.5 × IsCurtain)
+- ΔT_cooling = Time_drive × Rate_cooling
+
+Times are passed in minutes; coefficients are calibrated for hours.
+"""
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+
+@dataclass
+class RouteTemperatureProfile:
+    """Per-stop temperature arrays for one route (stops in visit order)."""
+    arrival_temp: np.ndarray
+    departure_temp: np.ndarray
+    transit_rise: np.ndarray
+    door_rise: np.ndarray
+    cooling_effect: np.ndarray
+    is_feasible: np.ndarray
+    violation_amount: np.ndarray
+
+
+def temperature_compliance_mask(
+    temps: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+) -> np.ndarray:
+    """
+    Check many temperatures against their limits in one pass.
+
+    Args:
+        temps: Temperatures to check (°C)
+        upper: Upper limit per temperature
+        lower: Lower limit per temperature (NaN = no lower bound)
+
+    Returns:
+        Boolean array, True where the temperature is compliant
+    """
+    # NaN lower limits compare False, i.e. "no lower bound"
+    return (temps <= upper) & ~(temps < lower)
+
+
+def simulate_route_temperatures(
+    travel_minutes: Sequence[float],
+    service_minutes: Sequence[float],
+    temp_limit_upper: Sequence[float],
+    temp_limit_lower: Sequence[float],
+    *,
+    initial_temp: float,
+    ambient_temp: float,
+    k_value: float,
+    door_coefficient: float,
+    has_strip_curtains: bool,
+    cooling_rate: float,
+) -> RouteTemperatureProfile:
+    """
+    Simulate compartment temperature along a route.
+
+    Args:
+        travel_minutes: Travel time into each stop from the previous one
+        service_minutes: Door-open service time at each stop
+        temp_limit_upper: Upper temperature limit per stop
+        temp_limit_lower: Lower temperature limit per stop (NaN = none)
+        initial_temp: Compartment temperature when leaving the depot
+        ambient_temp: Outside temperature (°C)
+        k_value: Vehicle insulation K-value
+        door_coefficient: Vehicle door coefficient
+        has_strip_curtains: Whether strip curtains halve door heat loss
+        cooling_rate: Refrigeration rate (°C per hour, negative = cooling)
+
+    Returns:
+        RouteTemperatureProfile with one entry per stop
+    """
+    travel_hours = np.asarray(travel_minutes, dtype=np.float64) / 60.0
+    service_hours = np.asarray(service_minutes, dtype=np.float64) / 60.0
+    curtain_factor = 0.5 if has_strip_curtains else 1.0
+
+    # Terms that do not depend on the current temperature
+    drive_factor = travel_hours * k_value
+    cooling_effect = travel_hours * cooling_rate
+    door_rise = service_hours * (door_coefficient * curtain_factor)
+
+    # Each stop starts from the previous departure temperature, so only the
+    # starting temperatures need a sequential pass
+    start_temp = np.empty_like(travel_hours)
+    current = initial_temp
+    for i, (factor, cooling, door) in enumerate(
+        zip(drive_factor.tolist(), cooling_effect.tolist(), door_rise.tolist())
+    ):
+        start_temp[i] = current
+        arrival = current + factor * (ambient_temp - current) + cooling
+        current = arrival + door
+
+    transit_rise = drive_factor * (ambient_temp - start_temp)
+    arrival_temp = start_temp + transit_rise + cooling_effect
+    departure_temp = arrival_temp + door_rise
+
+    upper = np.asarray(temp_limit_upper, dtype=np.float64)
+    lower = np.asarray(temp_limit_lower, dtype=np.float64)
+    is_feasible = temperature_compliance_mask(arrival_temp, upper, lower)
+    violation_amount = np.maximum(arrival_temp - upper, 0.0)
+    violation_amount = np.where(
+        arrival_temp < lower,
+        np.maximum(violation_amount, lower - arrival_temp),
+        violation_amount,
+    )
+
+    return RouteTemperatureProfile(
+        arrival_temp=arrival_temp,
+        departure_temp=departure_temp,
+        transit_rise=transit_rise,
+        door_rise=door_rise,
+        cooling_effect=cooling_effect,
+        is_feasible=is_feasible,
+        violation_amount=violation_amount,
+    )
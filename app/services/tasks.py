@@ -3,7 +3,7 @@ Celery tasks for ICCDDS.
 
 Contains the main optimization task that runs OR-Tools solver asynchronously.
 """
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
 from typing import Optional, Any
 from uuid import UUID
@@ -12,7 +12,9 @@ import traceback
 import threading
 
 from celery import shared_task
-from sqlalchemy import create_engine, select, update
+from celery.signals import worker_ready
+from sqlalchemy import Float, cast, create_engine, func, insert, select, text, update
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -26,6 +28,11 @@ from app.services.solver import (
 logger = logging.getLogger(__name__)
 
 
+def _make_point(longitude, latitude):
+    """Build a server-side PostGIS point (SRID 4326) without a WKT round trip."""
+    return func.ST_SetSRID(func.ST_MakePoint(float(longitude), float(latitude)), 4326)
+
+
 def _run_progress_updater(
     engine,
     job_id: str,
@@ -59,7 +66,7 @@ def _run_progress_updater(
                 stmt = (
                     update(OptimizationJob)
                     .where(OptimizationJob.id == UUID(job_id))
-                    .values(progress=progress, updated_at=datetime.now())
+                    .values(progress=progress, updated_at=datetime.now(timezone.utc))
                 )
                 session.execute(stmt)
                 session.commit()
@@ -141,7 +148,7 @@ def run_optimization(
     with Session(sync_engine) as session:
         try:
             # Update job status to RUNNING with initial progress
-            _update_job_status(session, job_id, "RUNNING", started_at=datetime.now(), progress=5)
+            _update_job_status(session, job_id, "RUNNING", started_at=datetime.now(timezone.utc), progress=5)
 
             # Load vehicles
             vehicles = _load_vehicles(session, vehicle_ids)
@@ -245,7 +252,7 @@ def _update_job_status(
     """Update optimization job status."""
     from app.models import OptimizationJob
 
-    values = {"status": status, "updated_at": datetime.now()}
+    values = {"status": status, "updated_at": datetime.now(timezone.utc)}
     if started_at:
         values["started_at"] = started_at
     if progress is not None:
@@ -270,14 +277,15 @@ def _update_job_completed(
     """Update job as completed with results."""
     from app.models import OptimizationJob
 
+    now = datetime.now(timezone.utc)
     stmt = (
         update(OptimizationJob)
         .where(OptimizationJob.id == UUID(job_id))
         .values(
             status="COMPLETED",
             progress=100,
-            completed_at=datetime.now(),
-            updated_at=datetime.now(),
+            completed_at=now,
+            updated_at=now,
             route_ids=[UUID(rid) for rid in route_ids],
             result_summary=result_summary,
             unassigned_shipment_ids=[UUID(sid) for sid in unassigned_ids] if unassigned_ids else None,
@@ -295,13 +303,14 @@ def _update_job_failed(
     """Update job as failed with error details."""
     from app.models import OptimizationJob
 
+    now = datetime.now(timezone.utc)
     stmt = (
         update(OptimizationJob)
         .where(OptimizationJob.id == UUID(job_id))
         .values(
             status="FAILED",
-            completed_at=datetime.now(),
-            updated_at=datetime.now(),
+            completed_at=now,
+            updated_at=now,
             error_message=error_message,
             error_traceback=error_traceback,
         )
@@ -313,31 +322,36 @@ def _load_vehicles(
     session: Session,
     vehicle_ids: Optional[list[str]] = None,
 ) -> list[dict]:
-    """Load available vehicles from database."""
+    """Load available vehicles from database.
+
+    Only the solver's columns are fetched, with numerics cast to float8 in
+    SQL, so no ORM objects, eager relationship loads or Decimals are built.
+    """
     from app.models import Vehicle, VehicleStatus
 
-    query = select(Vehicle).where(Vehicle.status == VehicleStatus.AVAILABLE)
+    query = select(
+        Vehicle.id,
+        Vehicle.license_plate,
+        Vehicle.driver_id,
+        Vehicle.driver_name,
+        cast(Vehicle.capacity_weight, Float).label("capacity_weight"),
+        cast(Vehicle.capacity_volume, Float).label("capacity_volume"),
+        cast(Vehicle.k_value, Float).label("k_value"),
+        cast(Vehicle.door_coefficient, Float).label("door_coefficient"),
+        Vehicle.has_strip_curtains,
+        cast(Vehicle.cooling_rate, Float).label("cooling_rate"),
+    ).where(Vehicle.status == VehicleStatus.AVAILABLE)
 
     if vehicle_ids:
         query = query.where(Vehicle.id.in_([UUID(vid) for vid in vehicle_ids]))
 
-    result = session.execute(query)
-    vehicles = result.scalars().all()
-
     return [
         {
-            "id": str(v.id),
-            "license_plate": v.license_plate,
-            "driver_id": str(v.driver_id) if v.driver_id else None,
-            "driver_name": v.driver_name,
-            "capacity_weight": float(v.capacity_weight),
-            "capacity_volume": float(v.capacity_volume),
-            "k_value": float(v.k_value),
-            "door_coefficient": float(v.door_coefficient),
-            "has_strip_curtains": v.has_strip_curtains,
-            "cooling_rate": float(v.cooling_rate),
+            **row,
+            "id": str(row["id"]),
+            "driver_id": str(row["driver_id"]) if row["driver_id"] else None,
         }
-        for v in vehicles
+        for row in session.execute(query).mappings()
     ]
 
 
@@ -345,35 +359,43 @@ def _load_shipments(
     session: Session,
     shipment_ids: Optional[list[str]] = None,
 ) -> list[dict]:
-    """Load pending shipments from database."""
+    """Load pending shipments from database.
+
+    Like _load_vehicles, fetches plain column rows with numerics cast to
+    float8 in SQL rather than building ORM objects.
+    """
     from app.models import Shipment, ShipmentStatus
 
-    query = select(Shipment).where(Shipment.status == ShipmentStatus.PENDING)
+    query = select(
+        Shipment.id,
+        Shipment.order_number,
+        Shipment.customer_id,
+        Shipment.delivery_address,
+        cast(Shipment.latitude, Float).label("latitude"),
+        cast(Shipment.longitude, Float).label("longitude"),
+        Shipment.time_windows,
+        Shipment.sla_tier,
+        cast(Shipment.temp_limit_upper, Float).label("temp_limit_upper"),
+        cast(Shipment.temp_limit_lower, Float).label("temp_limit_lower"),
+        Shipment.service_duration,
+        cast(Shipment.weight, Float).label("weight"),
+        cast(Shipment.volume, Float).label("volume"),
+        Shipment.priority,
+    ).where(Shipment.status == ShipmentStatus.PENDING)
 
     if shipment_ids:
         query = query.where(Shipment.id.in_([UUID(sid) for sid in shipment_ids]))
 
-    result = session.execute(query)
-    shipments = result.scalars().all()
-
     return [
         {
-            "id": str(s.id),
-            "order_number": s.order_number,
-            "customer_id": str(s.customer_id) if s.customer_id else None,
-            "delivery_address": s.delivery_address,
-            "latitude": float(s.latitude),
-            "longitude": float(s.longitude),
-            "time_windows": s.time_windows,
-            "sla_tier": s.sla_tier.value,
-            "temp_limit_upper": float(s.temp_limit_upper),
-            "temp_limit_lower": float(s.temp_limit_lower) if s.temp_limit_lower else None,
-            "service_duration": s.service_duration,
-            "weight": float(s.weight),
-            "volume": float(s.volume) if s.volume else 0,
-            "priority": s.priority,
+            **row,
+            "id": str(row["id"]),
+            "customer_id": str(row["customer_id"]) if row["customer_id"] else None,
+            "sla_tier": row["sla_tier"].value,
+            "temp_limit_lower": row["temp_limit_lower"] if row["temp_limit_lower"] else None,
+            "volume": row["volume"] if row["volume"] else 0,
         }
-        for s in shipments
+        for row in session.execute(query).mappings()
     ]
 
 
@@ -384,12 +406,17 @@ def _save_routes(
     result: SolverResult,
     data_model,
 ) -> list[str]:
-    """Save optimized routes to database."""
+    """Save optimized routes to database.
+
+    Routes and stops are collected as plain dicts and written with one
+    multi-row INSERT per table instead of a per-object flush.
+    """
     from app.models import Route, RouteStop, RouteStatus
     from uuid import uuid4
-    from geoalchemy2.elements import WKTElement
 
     route_ids = []
+    route_rows = []
+    stop_rows = []
 
     for idx, route_result in enumerate(result.routes):
         # Create route with unique code (include job ID suffix to avoid conflicts)
@@ -400,7 +427,7 @@ def _save_routes(
         # Get depot location
         depot = data_model.nodes[0]
 
-        route = Route(
+        route_rows.append(dict(
             id=route_id,
             route_code=route_code,
             plan_date=plan_date,
@@ -409,13 +436,14 @@ def _save_routes(
             driver_name=route_result.driver_name,
             status=RouteStatus.SCHEDULED,
             total_stops=route_result.num_stops,
-            total_distance=Decimal(str(route_result.total_distance_meters / 1000)),
+            total_distance=route_result.total_distance_meters / 1000,
             total_duration=route_result.total_duration_minutes,
-            total_weight=Decimal(str(route_result.total_weight_kg)),
-            total_volume=Decimal(str(route_result.total_volume_m3)),
-            initial_temperature=Decimal(str(route_result.initial_temp)),
-            predicted_final_temp=Decimal(str(route_result.final_temp)),
-            predicted_max_temp=Decimal(str(route_result.max_temp)),
+            total_weight=route_result.total_weight_kg,
+            total_volume=route_result.total_volume_m3,
+            initial_temperature=route_result.initial_temp,
+            predicted_final_temp=route_result.final_temp,
+            predicted_max_temp=route_result.max_temp,
+            route_feasible=route_result.is_temperature_feasible,
             planned_departure_at=datetime.combine(
                 plan_date,
                 datetime.min.time()
@@ -425,21 +453,20 @@ def _save_routes(
                 datetime.min.time()
             ) + timedelta(minutes=route_result.return_time_minutes),
             depot_address=depot.address,
-            depot_location=WKTElement(f"POINT({depot.longitude} {depot.latitude})", srid=4326),
+            depot_location=_make_point(depot.longitude, depot.latitude),
             optimization_job_id=UUID(job_id),
             optimization_cost=Decimal(str(result.total_cost)),
             algorithm_version="1.0.0",
-        )
-        session.add(route)
+        ))
 
         # Create route stops
         for stop in route_result.stops:
-            route_stop = RouteStop(
+            stop_rows.append(dict(
                 id=uuid4(),
                 route_id=route_id,
                 shipment_id=UUID(stop.shipment_id),
                 sequence_number=stop.sequence,
-                location=WKTElement(f"POINT({stop.longitude} {stop.latitude})", srid=4326),
+                location=_make_point(stop.longitude, stop.latitude),
                 address=stop.address,
                 expected_arrival_at=datetime.combine(
                     plan_date,
@@ -451,19 +478,26 @@ def _save_routes(
                 ) + timedelta(minutes=stop.departure_time_minutes),
                 target_time_window_index=stop.target_time_window_index,
                 slack_minutes=stop.slack_minutes,
-                predicted_arrival_temp=Decimal(str(stop.arrival_temp)),
-                transit_temp_rise=Decimal(str(stop.transit_temp_rise)),
-                service_temp_rise=Decimal(str(stop.door_temp_rise)),
-                cooling_applied=Decimal(str(stop.cooling_applied)),
-                predicted_departure_temp=Decimal(str(stop.departure_temp)),
+                predicted_arrival_temp=stop.arrival_temp,
+                transit_temp_rise=stop.transit_temp_rise,
+                service_temp_rise=stop.door_temp_rise,
+                cooling_applied=stop.cooling_applied,
+                predicted_departure_temp=stop.departure_temp,
                 is_temp_feasible=stop.is_temp_feasible,
-                distance_from_prev=Decimal(str(stop.distance_from_prev_meters / 1000)),
+                distance_from_prev=stop.distance_from_prev_meters / 1000,
                 travel_time_from_prev=stop.travel_time_from_prev_minutes,
-            )
-            session.add(route_stop)
+            ))
 
         route_ids.append(str(route_id))
 
+    # Routes first so the stops' route_id foreign keys resolve. The point
+    # columns are SQL expressions, so rows go in as one multi-row VALUES
+    # statement rather than an executemany
+    if route_rows:
+        session.execute(insert(Route).values(route_rows))
+    if stop_rows:
+        session.execute(insert(RouteStop).values(stop_rows))
+
     return route_ids
 
 
@@ -481,16 +515,105 @@ def _update_shipment_statuses(
         for stop in route_result.stops:
             shipment_route_map[stop.shipment_id] = (route_id, stop.sequence)
 
-    # Update assigned shipments
-    for shipment_id, (route_id, sequence) in shipment_route_map.items():
-        stmt = (
-            update(Shipment)
-            .where(Shipment.id == UUID(shipment_id))
-            .values(
-                status=ShipmentStatus.ASSIGNED,
-                route_id=UUID(route_id),
-                route_sequence=sequence,
-                updated_at=datetime.now(),
-            )
-        )
-        session.execute(stmt)
+    # Update assigned shipments as one executemany UPDATE keyed by primary key
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": UUID(shipment_id),
+            "status": ShipmentStatus.ASSIGNED,
+            "route_id": UUID(route_id),
+            "route_sequence": sequence,
+            "updated_at": now,
+        }
+        for shipment_id, (route_id, sequence) in shipment_route_map.items()
+    ]
+    if rows:
+        session.execute(update(Shipment), rows)
+
+
+# Daily temperature_logs partitions are named temperature_logs_pYYYYMMDD
+_PARTITION_PREFIX = "temperature_logs_p"
+
+
+@celery_app.task(name="app.services.tasks.maintain_temperature_log_partitions")
+def maintain_temperature_log_partitions() -> dict:
+    """
+    Create upcoming daily temperature_logs partitions and drop expired ones.
+
+    Runs daily from Celery beat. Partitions cover whole UTC days and are
+    created UNLOGGED; partitions older than the retention window are
+    dropped, which replaces a DELETE + VACUUM over the whole table. Rows
+    that landed in the default partition (e.g. after a missed run) are
+    expired with a DELETE against the same cutoff.
+
+    Returns:
+        Names of the created and dropped partitions, and the number of
+        expired rows deleted from the default partition
+    """
+    today = datetime.now(timezone.utc).date()
+    cutoff = today - timedelta(days=settings.telemetry_retention_days)
+    created, dropped = [], []
+
+    with Session(sync_engine) as session:
+        existing = set(session.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'temperature_logs'::regclass"
+        )).scalars())
+
+        for offset in range(settings.telemetry_partitions_ahead + 1):
+            day = today + timedelta(days=offset)
+            name = f"{_PARTITION_PREFIX}{day:%Y%m%d}"
+            if name in existing:
+                continue
+            # DDL takes no bind parameters; only date.isoformat() output
+            # (digits and dashes) is spliced into the statement
+            start = day.isoformat()
+            end = (day + timedelta(days=1)).isoformat()
+            try:
+                # Savepoint: fails if the default partition already holds
+                # rows for this day, which must not block the other days
+                with session.begin_nested():
+                    session.execute(text(
+                        f"CREATE UNLOGGED TABLE {name} PARTITION OF temperature_logs "
+                        f"FOR VALUES FROM ('{start} 00:00+00'::timestamptz) "
+                        f"TO ('{end} 00:00+00'::timestamptz)"
+                    ))
+            except DBAPIError as e:
+                logger.error(
+                    f"Could not create partition {name}; readings for {start} "
+                    f"stay in temperature_logs_default: {e}"
+                )
+                continue
+            created.append(name)
+
+        for name in sorted(existing):
+            if not name.startswith(_PARTITION_PREFIX):
+                continue
+            day = datetime.strptime(name[len(_PARTITION_PREFIX):], "%Y%m%d").date()
+            if day < cutoff:
+                session.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+
+        default_deleted = session.execute(
+            text("DELETE FROM temperature_logs_default WHERE recorded_at < :cutoff"),
+            {"cutoff": datetime.combine(cutoff, datetime.min.time(), tzinfo=timezone.utc)},
+        ).rowcount
+
+        session.commit()
+
+    logger.info(
+        f"temperature_logs partitions created={created} dropped={dropped} "
+        f"default_deleted={default_deleted}"
+    )
+    return {"created": created, "dropped": dropped, "default_deleted": default_deleted}
+
+
+@worker_ready.connect
+def _ensure_temperature_log_partitions(**kwargs) -> None:
+    """Queue a partition maintenance run when a worker starts.
+
+    A fresh database or a missed beat run then never leaves the coming
+    days without partitions until the next scheduled run.
+    """
+    maintain_temperature_log_partitions.delay()
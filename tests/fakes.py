@@ -0,0 +1,68 @@
+"""In-memory stand-ins for the async DB session used by endpoint tests."""
+from typing import Any
+
+
+class FakeResult:
+    """Result of one FakeSession.execute call."""
+
+    def __init__(self, rows: list[Any]):
+        self._rows = rows
+        self.rowcount = len(rows)
+
+    def scalar_one_or_none(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def scalar_one(self) -> Any:
+        [row] = self._rows
+        return row
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return list(self._rows)
+
+    def mappings(self) -> "FakeResult":
+        return self
+
+    def unique(self) -> "FakeResult":
+        return FakeResult(list(dict.fromkeys(self._rows)))
+
+    def first(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class FakeSession:
+    """Replays queued results in order and records executed statements."""
+
+    def __init__(self, *results: list[Any], scalars: tuple[Any, ...] = ()):
+        self._results = list(results)
+        self._scalars = list(scalars)
+        self.statements: list[Any] = []
+        self.added: list[Any] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult(self._results.pop(0))
+
+    async def scalar(self, stmt: Any, *args: Any, **kwargs: Any) -> Any:
+        self.statements.append(stmt)
+        return self._scalars.pop(0)
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    async def flush(self) -> None:
+        pass
+
+    async def refresh(self, obj: Any) -> None:
+        pass
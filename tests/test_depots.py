@@ -0,0 +1,84 @@
+"""Tests for the depot endpoints."""
+from collections import namedtuple
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import depots
+from app.db.database import get_async_session
+from tests.fakes import FakeSession
+
+
+def _client(session: FakeSession) -> TestClient:
+    app = FastAPI()
+    app.include_router(depots.router, prefix="/depots")
+    app.dependency_overrides[get_async_session] = lambda: session
+    return TestClient(app)
+
+
+def _depot() -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        name="Taipei DC",
+        code="TPE-01",
+        address="No. 1, Section 1",
+        latitude=25.0330,
+        longitude=121.5654,
+        is_active=True,
+        contact_person=None,
+        contact_phone=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_get_depot_serializes_schema_fields():
+    depot = _depot()
+
+    response = _client(FakeSession([depot])).get(f"/depots/{depot.id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == set(depots.DepotResponse.model_fields)
+    assert body["id"] == str(depot.id)
+    assert body["latitude"] == depot.latitude
+    assert body["created_at"].startswith("2026-01-01T00:00:00")
+
+
+def test_get_depot_not_found():
+    response = _client(FakeSession([])).get(f"/depots/{uuid4()}")
+
+    assert response.status_code == 404
+
+
+_DepotRow = namedtuple("_DepotRow", [*depots.DepotResponse.model_fields, "total"])
+
+
+def _depot_row(depot: SimpleNamespace, total: int) -> _DepotRow:
+    return _DepotRow(*(getattr(depot, f) for f in depots.DepotResponse.model_fields), total)
+
+
+def test_list_depots_reads_total_from_rows():
+    rows = [_depot_row(_depot(), total=12), _depot_row(_depot(), total=12)]
+    session = FakeSession(rows)
+
+    response = _client(session).get("/depots", params={"skip": 10})
+
+    body = response.json()
+    assert body["total"] == 12
+    assert len(body["depots"]) == 2
+    assert set(body["depots"][0]) == set(depots.DepotResponse.model_fields)
+    assert len(session.statements) == 1
+
+
+def test_list_depots_past_last_page_counts_separately():
+    session = FakeSession([], scalars=(12,))
+
+    response = _client(session).get("/depots", params={"skip": 100})
+
+    assert response.json() == {"total": 12, "depots": []}
+    assert len(session.statements) == 2
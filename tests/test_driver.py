@@ -0,0 +1,23 @@
+"""Tests for the Driver model."""
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import Driver
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_license_valid_in_python():
+    assert Driver(license_expiry=date.today()).is_license_valid
+    assert Driver(license_expiry=date.today() + timedelta(days=30)).is_license_valid
+    assert not Driver(license_expiry=date.today() - timedelta(days=1)).is_license_valid
+
+
+def test_license_valid_sql_uses_server_date():
+    sql = _sql(select(Driver.id).where(Driver.is_license_valid))
+
+    assert "drivers.license_expiry >= CURRENT_DATE" in sql
@@ -0,0 +1,30 @@
+"""Tests for the application root endpoint."""
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import settings
+
+
+def test_docs_disabled_by_setting(monkeypatch):
+    monkeypatch.setattr(main, "settings", settings.model_copy(update={"enable_docs": False}))
+    app = main.create_application()
+
+    assert app.docs_url is None
+    assert app.openapi_url is None
+
+
+def test_root_omits_docs_when_disabled(monkeypatch):
+    monkeypatch.setattr(main.app, "docs_url", None)
+    monkeypatch.setattr(main.app, "openapi_url", None)
+
+    body = TestClient(main.app).get("/").json()
+
+    assert body["docs"] is None
+    assert body["openapi"] is None
+
+
+def test_root_reports_live_docs_urls():
+    body = TestClient(main.app).get("/").json()
+
+    assert body["docs"] == main.app.docs_url
+    assert body["openapi"] == main.app.openapi_url
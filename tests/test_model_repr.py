@@ -0,0 +1,18 @@
+"""Tests for model __repr__ methods."""
+from uuid import uuid4
+
+from app.models import Depot, Driver
+
+
+def test_driver_repr_quotes_strings():
+    driver_id = uuid4()
+    driver = Driver(id=driver_id, name="Chen", employee_id="E-001")
+
+    assert repr(driver) == f"<Driver(id={driver_id}, name='Chen', employee_id='E-001')>"
+
+
+def test_base_repr_shows_only_loaded_identifying_keys():
+    # Transient: id is unset until flush, so it is skipped rather than loaded
+    depot = Depot(name="Taipei DC", code="TPE-01")
+
+    assert super(Depot, depot).__repr__() == "<Depot(name='Taipei DC', code='TPE-01')>"
@@ -0,0 +1,31 @@
+"""Tests for the OptimizationJob model."""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import OptimizationJob
+
+
+def test_duration_seconds_in_python():
+    started = datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc)
+    job = OptimizationJob(started_at=started, completed_at=started + timedelta(seconds=90))
+
+    assert job.duration_seconds == 90.0
+
+
+def test_duration_seconds_is_none_until_completed():
+    job = OptimizationJob(started_at=datetime.now(timezone.utc))
+
+    assert job.duration_seconds is None
+
+
+def test_duration_seconds_sql_form():
+    stmt = select(OptimizationJob.id).where(OptimizationJob.duration_seconds > 60)
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert (
+        "EXTRACT(epoch FROM optimization_jobs.completed_at - optimization_jobs.started_at)"
+        in sql
+    )
@@ -0,0 +1,70 @@
+"""Tests for the window-count pagination helper."""
+from typing import NamedTuple
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.pagination import fetch_page, list_adapter
+from app.models import Vehicle
+from app.schemas.vehicle import VehicleResponse
+from tests.fakes import FakeSession
+
+QUERY = select(Vehicle, func.count().over().label("total"))
+COUNT_QUERY = select(func.count(Vehicle.id))
+
+
+class _Row(NamedTuple):
+    index: int
+    total: int
+
+
+def _rows(n: int, total: int) -> list[_Row]:
+    return [_Row(i, total) for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_total_comes_from_window_column():
+    session = FakeSession(_rows(2, total=7))
+
+    rows, total = await fetch_page(session, QUERY, COUNT_QUERY, skip=5)
+
+    assert len(rows) == 2
+    assert total == 7
+    assert session.statements == [QUERY]
+
+
+@pytest.mark.asyncio
+async def test_past_last_page_counts_separately():
+    session = FakeSession([], scalars=(7,))
+
+    rows, total = await fetch_page(session, QUERY, COUNT_QUERY, skip=100)
+
+    assert rows == []
+    assert total == 7
+    assert session.statements == [QUERY, COUNT_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_empty_first_page_skips_count():
+    session = FakeSession([])
+
+    rows, total = await fetch_page(session, QUERY, COUNT_QUERY, skip=0)
+
+    assert rows == []
+    assert total == 0
+    assert session.statements == [QUERY]
+
+
+@pytest.mark.asyncio
+async def test_unique_deduplicates_rows():
+    row = _Row(0, total=1)
+    session = FakeSession([row, row])
+
+    rows, total = await fetch_page(session, QUERY, COUNT_QUERY, skip=0, unique=True)
+
+    assert rows == [row]
+    assert total == 1
+
+
+def test_list_adapter_is_cached_per_schema():
+    assert list_adapter(VehicleResponse) is list_adapter(VehicleResponse)
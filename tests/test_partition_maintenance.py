@@ -0,0 +1,107 @@
+"""Tests for the temperature_logs partition maintenance task."""
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.services import tasks
+
+TODAY = date(2026, 3, 10)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2026, 3, 10, 12, 0, tzinfo=tz)
+
+
+class _Result:
+    def __init__(self, names=(), rowcount=0):
+        self._names = names
+        self.rowcount = rowcount
+
+    def scalars(self):
+        return iter(self._names)
+
+
+class _SyncSession:
+    """Stands in for the sync Session: serves the partition list, logs SQL."""
+
+    def __init__(self, existing, fail_on=()):
+        self.existing = existing
+        self.fail_on = fail_on
+        self.sql: list[str] = []
+        self.committed = False
+
+    def __call__(self, engine):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.sql.append(sql)
+        if "pg_inherits" in sql:
+            return _Result(names=self.existing)
+        if any(name in sql for name in self.fail_on):
+            raise DBAPIError(sql, params, Exception("default partition has rows"))
+        return _Result(rowcount=3 if sql.startswith("DELETE") else 0)
+
+    def commit(self):
+        self.committed = True
+
+
+def _partition(day: date) -> str:
+    return f"temperature_logs_p{day:%Y%m%d}"
+
+
+def _run(monkeypatch, session: _SyncSession) -> dict:
+    monkeypatch.setattr(tasks, "datetime", _FrozenDatetime)
+    monkeypatch.setattr(tasks, "Session", session)
+    return tasks.maintain_temperature_log_partitions.run()
+
+
+def test_creates_missing_days_and_drops_expired(monkeypatch):
+    expired = _partition(TODAY - timedelta(days=settings.telemetry_retention_days + 1))
+    kept = _partition(TODAY - timedelta(days=settings.telemetry_retention_days))
+    session = _SyncSession(existing=["temperature_logs_default", expired, kept, _partition(TODAY)])
+
+    summary = _run(monkeypatch, session)
+
+    assert summary["created"] == [
+        _partition(TODAY + timedelta(days=i))
+        for i in range(1, settings.telemetry_partitions_ahead + 1)
+    ]
+    assert summary["dropped"] == [expired]
+    assert summary["default_deleted"] == 3
+    assert session.committed
+    assert f"DROP TABLE {expired}" in session.sql
+
+
+def test_partition_bounds_are_utc_days(monkeypatch):
+    session = _SyncSession(existing=[])
+
+    _run(monkeypatch, session)
+
+    [create_today] = [sql for sql in session.sql if _partition(TODAY) in sql]
+    assert "CREATE UNLOGGED TABLE" in create_today
+    assert "FROM ('2026-03-10 00:00+00'::timestamptz)" in create_today
+    assert "TO ('2026-03-11 00:00+00'::timestamptz)" in create_today
+
+
+def test_failed_day_does_not_block_the_rest(monkeypatch):
+    session = _SyncSession(existing=[], fail_on=(_partition(TODAY),))
+
+    summary = _run(monkeypatch, session)
+
+    assert _partition(TODAY) not in summary["created"]
+    assert _partition(TODAY + timedelta(days=1)) in summary["created"]
+    assert session.committed
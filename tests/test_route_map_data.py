@@ -0,0 +1,89 @@
+"""Tests for the route map payload."""
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import routes
+from app.db.database import get_async_session_factory
+from tests.fakes import FakeSession
+
+
+class _Obj:
+    """Hashable attribute bag (unique() dedupes ORM entities by identity)."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+def _stop(seq: int, shipment=None, arrival=None) -> _Obj:
+    return _Obj(
+        id=uuid4(),
+        sequence_number=seq,
+        shipment_id=shipment.id if shipment else None,
+        shipment=shipment,
+        address=f"Stop {seq}",
+        expected_arrival_at=arrival,
+        expected_departure_at=None,
+        predicted_arrival_temp=4.5,
+        is_temp_feasible=True,
+    )
+
+
+def _route(stops) -> _Obj:
+    ordered = sorted(stops, key=lambda s: s.sequence_number)
+    return _Obj(
+        id=uuid4(),
+        vehicle_id=uuid4(),
+        vehicle=SimpleNamespace(license_plate="ABC-1234"),
+        total_distance=12.5,
+        total_duration=None,
+        get_stops_ordered=lambda: ordered,
+    )
+
+
+def _get(session: FakeSession):
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/routes")
+    app.dependency_overrides[get_async_session_factory] = lambda: lambda: session
+    return TestClient(app).get("/routes/map-data", params={"plan_date": "2026-03-10"})
+
+
+def test_stops_use_batched_coordinates():
+    shipment = SimpleNamespace(id=uuid4(), order_number="SO-1", temp_limit_upper=5.0)
+    first = _stop(1, shipment, arrival=datetime(2026, 3, 10, 9, 30))
+    second = _stop(2)
+    route = _route([second, first])
+    session = FakeSession(
+        [route],
+        [SimpleNamespace(lat=25.0, lon=121.5)],
+        [SimpleNamespace(id=first.id, lat=25.1, lon=121.6)],
+    )
+
+    body = _get(session).json()
+
+    assert len(session.statements) == 3
+    assert body["depot"] == {"lat": 25.0, "lon": 121.5}
+    [payload] = body["routes"]
+    assert payload["licensePlate"] == "ABC-1234"
+    assert payload["totalTime"] == 0
+    one, two = payload["stops"]
+    assert (one["sequence"], one["lat"], one["lon"]) == (1, 25.1, 121.6)
+    assert one["customerName"] == "SO-1"
+    assert one["arrivalTime"] == "09:30"
+    assert one["tempLimit"] == 5.0
+    # Stops without a stored location fall back to (0, 0)
+    assert (two["lat"], two["lon"]) == (0, 0)
+    assert two["customerName"] == "Unknown"
+    assert two["tempLimit"] == 8.0
+
+
+def test_no_routes_skips_coordinate_queries():
+    session = FakeSession([])
+
+    body = _get(session).json()
+
+    assert body == {"routes": [], "depot": None}
+    assert len(session.statements) == 1
@@ -0,0 +1,67 @@
+"""Tests for the Shipment time-window bitmask."""
+from datetime import time
+
+from app.models import Shipment
+
+
+def _shipment(*windows: tuple[str, str]) -> Shipment:
+    return Shipment(time_windows=[{"start": start, "end": end} for start, end in windows])
+
+
+def _mask_bits(shipment: Shipment) -> int:
+    return sum(word << (64 * i) for i, word in enumerate(shipment.time_mask))
+
+
+def test_mask_is_union_of_windows():
+    shipment = _shipment(("08:00", "10:00"), ("14:00", "16:00"))
+
+    bits = _mask_bits(shipment)
+
+    assert len(shipment.time_mask) == 23
+    assert [m for m in range(24 * 60) if bits >> m & 1] == (
+        list(range(8 * 60, 10 * 60 + 1)) + list(range(14 * 60, 16 * 60 + 1))
+    )
+
+
+def test_window_bounds_are_inclusive():
+    shipment = _shipment(("08:00", "10:00"))
+
+    assert shipment.is_time_valid(time(8, 0))
+    assert shipment.is_time_valid(time(10, 0))
+    assert not shipment.is_time_valid(time(7, 59))
+    assert not shipment.is_time_valid(time(10, 1))
+
+
+def test_seconds_are_compared_like_time_values():
+    shipment = _shipment(("08:00", "10:00"))
+
+    assert shipment.is_time_valid(time(9, 59, 59))
+    assert not shipment.is_time_valid(time(10, 0, 30))
+    assert not shipment.is_time_valid(time(7, 59, 59))
+
+
+def test_gap_between_adjacent_windows():
+    shipment = _shipment(("08:00", "10:00"), ("10:01", "12:00"))
+
+    assert shipment.is_time_valid(time(10, 0))
+    assert not shipment.is_time_valid(time(10, 0, 30))
+    assert shipment.is_time_valid(time(10, 1))
+
+
+def test_reversed_window_is_empty():
+    shipment = _shipment(("10:00", "08:00"))
+
+    assert _mask_bits(shipment) == 0
+    assert not shipment.is_time_valid(time(9, 0))
+
+
+def test_mask_follows_in_place_edits():
+    shipment = _shipment(("08:00", "10:00"))
+    assert not shipment.is_time_valid(time(15, 0))
+
+    shipment.time_windows.append({"start": "14:00", "end": "16:00"})
+    assert shipment.is_time_valid(time(15, 0))
+
+    shipment.time_windows[0]["end"] = "09:00"
+    assert not shipment.is_time_valid(time(9, 30))
+    assert shipment.get_latest_end() == time(16, 0)
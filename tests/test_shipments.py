@@ -0,0 +1,85 @@
+"""Tests for the shipment create endpoint."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.endpoints import shipments
+from app.db.database import get_async_session
+from app.models import ShipmentStatus, SLATier
+from tests.fakes import FakeSession
+
+PAYLOAD = {
+    "order_number": "SO-1",
+    "delivery_address": "No. 7, Xinyi Rd",
+    "latitude": "25.03",
+    "longitude": "121.56",
+    "weight": "12.5",
+    "time_windows": [{"start": "08:00", "end": "10:00"}],
+    "temp_limit_upper": "5.0",
+}
+
+
+def _client(session: FakeSession) -> TestClient:
+    app = FastAPI()
+    app.include_router(shipments.router, prefix="/shipments")
+    app.dependency_overrides[get_async_session] = lambda: session
+    return TestClient(app)
+
+
+def _shipment() -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        order_number="SO-1",
+        customer_id=None,
+        delivery_address="No. 7, Xinyi Rd",
+        latitude=25.03,
+        longitude=121.56,
+        weight=12.5,
+        time_windows=[{"start": "08:00", "end": "10:00"}],
+        sla_tier=SLATier.STANDARD,
+        temp_limit_upper=5.0,
+        temp_limit_lower=None,
+        service_duration=15,
+        volume=None,
+        dimensions=None,
+        package_count=1,
+        status=ShipmentStatus.PENDING,
+        route_id=None,
+        route_sequence=None,
+        actual_arrival_at=None,
+        actual_temperature=None,
+        was_on_time=None,
+        was_temp_compliant=None,
+        priority=50,
+        special_instructions=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_create_inserts_with_returning():
+    session = FakeSession([], [_shipment()])
+
+    response = _client(session).post("/shipments", json=PAYLOAD)
+
+    assert response.status_code == 201
+    assert response.json()["order_number"] == "SO-1"
+    _, insert_stmt = session.statements
+    sql = str(insert_stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO shipments")
+    assert "ST_SetSRID(ST_MakePoint(" in sql
+    assert "RETURNING" in sql
+
+
+def test_create_duplicate_order_number_is_400():
+    session = FakeSession([object()])
+
+    response = _client(session).post("/shipments", json=PAYLOAD)
+
+    assert response.status_code == 400
+    assert len(session.statements) == 1
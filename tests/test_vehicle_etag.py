@@ -0,0 +1,90 @@
+"""Tests for the vehicle thermodynamics ETag / If-None-Match handling."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import vehicles
+from app.api.v1.endpoints.vehicles import _etag_matches, _thermo_etag
+from app.db.database import get_async_read_session
+from app.models import DoorType, InsulationGrade
+from tests.fakes import FakeSession
+
+ETAG = '"abc123"'
+
+
+def test_exact_tag_matches():
+    assert _etag_matches(ETAG, ETAG)
+
+
+def test_weak_tag_matches():
+    assert _etag_matches(f"W/{ETAG}", ETAG)
+
+
+def test_tag_list_matches():
+    assert _etag_matches(f'"other", W/{ETAG}', ETAG)
+
+
+def test_star_matches():
+    assert _etag_matches(" * ", ETAG)
+
+
+def test_mismatch_and_missing_header():
+    assert not _etag_matches('"other"', ETAG)
+    assert not _etag_matches(None, ETAG)
+    assert not _etag_matches("", ETAG)
+
+
+def _client(vehicle) -> TestClient:
+    app = FastAPI()
+    app.include_router(vehicles.router, prefix="/vehicles")
+    app.dependency_overrides[get_async_read_session] = lambda: FakeSession([vehicle])
+    return TestClient(app)
+
+
+def _vehicle() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        license_plate="ABC-1234",
+        insulation_grade=InsulationGrade.STANDARD,
+        k_value=0.05,
+        door_type=DoorType.ROLL,
+        door_coefficient=0.8,
+        has_strip_curtains=True,
+        cooling_rate=-2.5,
+        min_temp_capability=-25.0,
+        updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_thermodynamics_returns_etag_then_304():
+    vehicle = _vehicle()
+    client = _client(vehicle)
+    url = f"/vehicles/{vehicle.id}/thermodynamics"
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert etag == _thermo_etag(vehicle.id, vehicle.updated_at)
+
+    cached = client.get(url, headers={"If-None-Match": f"W/{etag}"})
+
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+
+def test_thermodynamics_stale_tag_gets_body():
+    vehicle = _vehicle()
+    client = _client(vehicle)
+
+    response = client.get(
+        f"/vehicles/{vehicle.id}/thermodynamics",
+        headers={"If-None-Match": '"stale"'},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["license_plate"] == "ABC-1234"
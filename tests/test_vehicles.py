@@ -0,0 +1,106 @@
+"""Tests for the vehicle write endpoints."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.endpoints import vehicles
+from app.db.database import get_async_session
+from app.models import DoorType, InsulationGrade, VehicleStatus
+from tests.fakes import FakeSession
+
+
+def _client(session: FakeSession) -> TestClient:
+    app = FastAPI()
+    app.include_router(vehicles.router, prefix="/vehicles")
+    app.dependency_overrides[get_async_session] = lambda: session
+    return TestClient(app)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _vehicle(**overrides) -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    fields = dict(
+        id=uuid4(),
+        license_plate="ABC-1234",
+        capacity_weight=1000.0,
+        capacity_volume=10.0,
+        driver_id=None,
+        driver_name=None,
+        internal_length=None,
+        internal_width=None,
+        internal_height=None,
+        insulation_grade=InsulationGrade.STANDARD,
+        k_value=0.05,
+        door_type=DoorType.ROLL,
+        door_coefficient=0.8,
+        has_strip_curtains=False,
+        cooling_rate=-2.5,
+        min_temp_capability=-25.0,
+        status=VehicleStatus.AVAILABLE,
+        current_temperature=None,
+        last_telemetry_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_update_is_one_update_returning():
+    vehicle = _vehicle(insulation_grade=InsulationGrade.PREMIUM, k_value=0.02)
+    session = FakeSession([vehicle])
+
+    response = _client(session).patch(
+        f"/vehicles/{vehicle.id}", json={"insulation_grade": "PREMIUM"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["insulation_grade"] == "PREMIUM"
+    [stmt] = session.statements
+    sql = _sql(stmt)
+    assert sql.startswith("UPDATE vehicles SET")
+    assert "k_value=" in sql
+    assert "RETURNING" in sql
+
+
+def test_update_missing_vehicle_is_404():
+    session = FakeSession([])
+
+    response = _client(session).patch(f"/vehicles/{uuid4()}", json={"driver_name": "Lin"})
+
+    assert response.status_code == 404
+    assert len(session.statements) == 1
+
+
+def test_empty_update_only_selects():
+    vehicle = _vehicle()
+    session = FakeSession([vehicle])
+
+    response = _client(session).patch(f"/vehicles/{vehicle.id}", json={})
+
+    assert response.status_code == 200
+    [stmt] = session.statements
+    assert _sql(stmt).startswith("SELECT")
+
+
+def test_delete_is_one_statement():
+    session = FakeSession([object()])
+
+    response = _client(session).delete(f"/vehicles/{uuid4()}")
+
+    assert response.status_code == 204
+    [stmt] = session.statements
+    assert _sql(stmt).startswith("DELETE FROM vehicles")
+
+
+def test_delete_missing_vehicle_is_404():
+    response = _client(FakeSession([])).delete(f"/vehicles/{uuid4()}")
+
+    assert response.status_code == 404